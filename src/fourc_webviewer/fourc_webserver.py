@@ -3,6 +3,7 @@ state, synchronizes server variables, and handles PyVista rendering for the 4C
 web viewer."""
 
 import copy
+import functools
 import re
 import tempfile
 from pathlib import Path
@@ -40,10 +41,122 @@ from fourc_webviewer.read_geometry_from_file import (
 # Global variable
 # factor which scales the spheres used to represent nodal design conditions and result descriptions with respect to the problem length scale
 PV_SPHERE_FRAC_SCALE = 1.0 / 75.0
+# maximum length of the input error messages displayed in the GUI
+MAX_ERROR_MESSAGE_LENGTH = 100
 
 # always set pyvista to plot off screen with Trame
 pv.OFF_SCREEN = True
 
+# substrings of section names which are not handled as general sections
+GENERAL_SECTIONS_SUBSTR_TO_EXCLUDE = [
+    "DESIGN",
+    "TOPOLOGY",
+    "ELEMENTS",
+    "NODE",
+    "FUNCT",
+    "GEOMETRY",
+]
+# full section names which are not handled as general sections
+GENERAL_SECTIONS_TO_EXCLUDE = [
+    "MATERIALS",
+    "TITLE",
+    "CLONING MATERIAL MAP",
+    "RESULT DESCRIPTION",
+]
+
+
+def is_general_section(section_name):
+    """Check whether a section is handled as a general section.
+
+    Args:
+        section_name (str): name of the section.
+    Returns:
+        bool: True if the section is a general section.
+    """
+    return (
+        not any(substr in section_name for substr in GENERAL_SECTIONS_SUBSTR_TO_EXCLUDE)
+        and section_name not in GENERAL_SECTIONS_TO_EXCLUDE
+    )
+
+
+@functools.cache
+def get_addable_section_names():
+    """Get the names of all general sections of the 4C json schema, which can
+    be added via the GUI.
+
+    The result only depends on the json schema, so that it is computed
+    once and cached.
+
+    Returns:
+        list: names of the addable sections.
+    """
+    return [k for k in CONFIG.fourc_json_schema["properties"] if is_general_section(k)]
+
+
+@functools.cache
+def get_schema_lowercase_index():
+    """Get a lookup of the lowercase versions of all section names, property
+    names and (string) enum values of the 4C json schema.
+
+    The lookup is used by the client-side autocomplete filter, so that
+    the items are not lowercased on every keystroke. It only depends on
+    the json schema, so that it is computed once and cached.
+
+    Returns:
+        dict: lowercase version for each name / enum value.
+    """
+    lowercase_index = {}
+    for section_name, section_schema in CONFIG.fourc_json_schema["properties"].items():
+        lowercase_index[section_name] = section_name.lower()
+        if not isinstance(section_schema, dict):
+            continue
+        for property_name, property_schema in section_schema.get(
+            "properties", {}
+        ).items():
+            lowercase_index[property_name] = property_name.lower()
+            if not isinstance(property_schema, dict):
+                continue
+            for enum_value in property_schema.get("enum", []):
+                if isinstance(enum_value, str):
+                    lowercase_index[enum_value] = enum_value.lower()
+    return lowercase_index
+
+
+@functools.cache
+def get_material_types_index():
+    """Get the descriptions of all material types and their parameters from
+    the 4C json schema.
+
+    This replaces searching the list of material schemas on every
+    render. It only depends on the json schema, so that it is computed
+    once and cached.
+
+    Returns:
+        dict: for each material type, a dict containing its description
+        ("description") and the descriptions of its parameters
+        ("parameters").
+    """
+    material_types_index = {}
+    for material_schema in CONFIG.fourc_json_schema["properties"]["MATERIALS"]["items"][
+        "oneOf"
+    ]:
+        for material_type, material_type_schema in material_schema.get(
+            "properties", {}
+        ).items():
+            # the first match wins (as for Array.prototype.find)
+            if material_type == "MAT" or material_type in material_types_index:
+                continue
+            material_types_index[material_type] = {
+                "description": material_type_schema.get("description"),
+                "parameters": {
+                    param_name: param_schema.get("description")
+                    for param_name, param_schema in material_type_schema.get(
+                        "properties", {}
+                    ).items()
+                },
+            }
+    return material_types_index
+
 
 @TrameApp()
 class FourCWebServer:
@@ -90,6 +203,11 @@ class FourCWebServer:
         # read-in and export status, ...)
         self.init_mode_state_vars()
 
+        # version counter of the displayed section content: used as key
+        # for the v-once view mode tables, which are only re-rendered
+        # once this counter changes
+        self.state.view_version = 0
+
         # read basic fourc yaml file info and store either to state or
         # server vars
         (
@@ -173,6 +291,8 @@ class FourCWebServer:
         # dict to store input errors for the input validation
         # imitates structure of self.state.general_sections
         self.state.input_error_dict = {}
+        # new content: invalidate the v-once view mode tables
+        self.state.view_version += 1
 
         # get state variables of the general sections
         self.init_general_sections_state_and_server_vars()
@@ -221,6 +341,11 @@ class FourCWebServer:
         self.state.selected_section_name = self.state.section_names[
             self.state.selected_main_section_name
         ]["subsections"][0]
+        self.state.general_section_entries = self.get_entries(
+            self.state.general_sections,
+            self.state.selected_main_section_name,
+            self.state.selected_section_name,
+        )
 
         return
 
@@ -424,34 +549,18 @@ class FourCWebServer:
 
         self.state.json_schema = CONFIG.fourc_json_schema
 
-        # define substrings of section names to exclude
-        substr_to_exclude = [
-            "DESIGN",
-            "TOPOLOGY",
-            "ELEMENTS",
-            "NODE",
-            "FUNCT",
-            "GEOMETRY",
-        ]
-        # define full section names to exclude
-        sect_to_exclude = [
-            "MATERIALS",
-            "TITLE",
-            "CLONING MATERIAL MAP",
-            "RESULT DESCRIPTION",
-        ]
-
         # loop through input file sections
         self.state.general_sections = {}
         self.state.add_section = ""
+        self.state.addable_section_names = get_addable_section_names()
+        self.state.schema_lowercase_index = get_schema_lowercase_index()
         self.state.add_key = ""  # key for the add property row
         self.state.add_value = ""  # value for the add property row
         for section_name, section_data in self._server_vars[
             "fourc_yaml_content"
         ].sections.items():
-            if (
-                not any(substr in section_name for substr in substr_to_exclude)
-                and section_name not in sect_to_exclude
+            if is_general_section(
+                section_name
             ):  # account for sections to be excluded as defined above
                 # check if the current section is "SOLVER<number>"
                 if re.match("^SOLVER [0-9]+", section_name):  # yes
@@ -508,12 +617,22 @@ class FourCWebServer:
             )
 
             # we keep the cloning material map in the same structure in
-            # our state
-            self.state.cloning_material_map_section = cloning_material_map_section
+            # our state, but add a stable identifier to each item (used as
+            # key for the list rendering)
+            self.state.cloning_material_map_section = [
+                dict(
+                    cmm_item,
+                    id=f"{cmm_item['SRC_FIELD']}|{cmm_item['SRC_MAT']}|{cmm_item['TAR_FIELD']}|{cmm_item['TAR_MAT']}",
+                )
+                for cmm_item in cloning_material_map_section
+            ]
 
         except:
             pass
 
+        # get the descriptions of the material types and their parameters
+        self.state.material_types_index = get_material_types_index()
+
         # get the material state variable
         self.state.materials_section = {}
         for material in materials_section:
@@ -575,6 +694,15 @@ class FourCWebServer:
 
         # set user selection variables
         self.state.selected_material = next(iter(self.state.materials_section), None)
+        self.state.relationships_view = self.get_relationships_view(
+            self.state.materials_section, self.state.selected_material
+        )
+        self.state.material_param_entries = self.get_entries(
+            self.state.materials_section, self.state.selected_material, "PARAMETERS"
+        )
+        self.state.material_param_kinds = self.get_kinds(
+            self.state.materials_section, self.state.selected_material, "PARAMETERS"
+        )
         if self.state.selected_material in self.state.materials_section:
             self.state.selected_material_param = next(
                 iter(
@@ -584,6 +712,12 @@ class FourCWebServer:
                 ),
                 None,
             )
+        self.state.material_param_fields = self.get_fields(
+            self.state.materials_section,
+            self.state.selected_material,
+            "PARAMETERS",
+            self.state.selected_material_param,
+        )
 
     def sync_materials_sections_from_state(self):
         """Syncs the server-side materials (and cloning material map) sections
@@ -613,8 +747,12 @@ class FourCWebServer:
                 {"MAT": mat_id, f"{mat_type}": mat_item_val["PARAMETERS"]}
             )
 
-        # set the new cloning material map section
-        new_cloning_material_map_section = copy_cloning_material_map_section
+        # set the new cloning material map section (without the identifier
+        # added within the init_ routine)
+        new_cloning_material_map_section = [
+            {k: v for k, v in cmm_item.items() if k != "id"}
+            for cmm_item in copy_cloning_material_map_section
+        ]
 
         # write to server-side content
         self._server_vars["fourc_yaml_content"]["MATERIALS"] = new_materials_section
@@ -695,6 +833,9 @@ class FourCWebServer:
 
         # set user selection variables
         self.state.selected_dc_geometry_type = next(iter(self.state.dc_sections), None)
+        self.state.dc_ready = self.is_dc_ready(
+            self.state.dc_sections, self.state.selected_dc_geometry_type
+        )
         if self.state.selected_dc_geometry_type in self.state.dc_sections:
             self.state.selected_dc_entity = next(
                 iter(self.state.dc_sections[self.state.selected_dc_geometry_type]), None
@@ -711,6 +852,12 @@ class FourCWebServer:
                     ),
                     None,
                 )
+        self.set_dc_entries(
+            self.state.dc_sections,
+            self.state.selected_dc_geometry_type,
+            self.state.selected_dc_entity,
+            self.state.selected_dc_condition,
+        )
 
     def sync_design_conditions_sections_from_state(self):
         """Syncs the server-side design sections based on the current values of
@@ -776,6 +923,16 @@ class FourCWebServer:
         self.state.selected_result_description_id = next(
             iter(self.state.result_description_section), None
         )  # set the selected result description by id
+        self.state.result_description_param_entries = self.get_entries(
+            self.state.result_description_section,
+            self.state.selected_result_description_id,
+            "PARAMETERS",
+        )
+        self.state.result_description_param_kinds = self.get_kinds(
+            self.state.result_description_section,
+            self.state.selected_result_description_id,
+            "PARAMETERS",
+        )
         if (
             self.state.selected_result_description_id
             in self.state.result_description_section
@@ -788,6 +945,12 @@ class FourCWebServer:
                 ),
                 None,
             )
+        self.state.result_description_param_fields = self.get_fields(
+            self.state.result_description_section,
+            self.state.selected_result_description_id,
+            "PARAMETERS",
+            self.state.selected_result_description_param,
+        )
 
     def sync_result_description_section_from_state(self):
         """Syncs the server-side result description section based on the
@@ -1173,6 +1336,20 @@ class FourCWebServer:
         """Reaction to change of state.selected_section_name."""
         self.state.selected_subsection_name = selected_section_name.split("/")[-1]
 
+    @change("general_sections", "selected_main_section_name", "selected_section_name")
+    def change_general_section_entries(
+        self,
+        general_sections,
+        selected_main_section_name,
+        selected_section_name,
+        **kwargs,
+    ):
+        """Reaction to change of state.general_sections or the section
+        selection."""
+        self.state.general_section_entries = self.get_entries(
+            general_sections, selected_main_section_name, selected_section_name
+        )
+
     @change("selected_material")
     def change_selected_material(self, selected_material, **kwargs):
         """Reaction to change of state.selected_material."""
@@ -1195,6 +1372,42 @@ class FourCWebServer:
             # increment render counter
             self._server_vars["render_count"]["change_selected_material"] += 1
 
+    @change("selected_material", "materials_section")
+    def change_relationships_view(self, selected_material, materials_section, **kwargs):
+        """Reaction to change of state.selected_material or
+        state.materials_section."""
+        self.state.relationships_view = self.get_relationships_view(
+            materials_section, selected_material
+        )
+
+    @change("selected_material", "materials_section")
+    def change_material_param_entries(
+        self, selected_material, materials_section, **kwargs
+    ):
+        """Reaction to change of state.selected_material or
+        state.materials_section."""
+        self.state.material_param_entries = self.get_entries(
+            materials_section, selected_material, "PARAMETERS"
+        )
+        self.state.material_param_kinds = self.get_kinds(
+            materials_section, selected_material, "PARAMETERS"
+        )
+        # re-render the v-once view mode tables only for a new selection:
+        # the section content is edited in edit mode, where they are not
+        # shown
+        if "selected_material" in self.state.modified_keys:
+            self.state.view_version += 1
+
+    @change("materials_section", "selected_material", "selected_material_param")
+    def change_material_param_fields(
+        self, materials_section, selected_material, selected_material_param, **kwargs
+    ):
+        """Reaction to change of state.materials_section or the material
+        parameter selection."""
+        self.state.material_param_fields = self.get_fields(
+            materials_section, selected_material, "PARAMETERS", selected_material_param
+        )
+
     @change("selected_dc_geometry_type")
     def change_selected_dc_geometry_type(self, selected_dc_geometry_type, **kwargs):
         """Reaction to change of state.selected_dc_geometry_type."""
@@ -1218,6 +1431,42 @@ class FourCWebServer:
         # update the pyvista local view
         self.ctrl.view_update()
 
+    @change("dc_sections", "selected_dc_geometry_type")
+    def change_dc_ready(self, dc_sections, selected_dc_geometry_type, **kwargs):
+        """Reaction to change of state.dc_sections or
+        state.selected_dc_geometry_type."""
+        self.state.dc_ready = self.is_dc_ready(dc_sections, selected_dc_geometry_type)
+
+    @change(
+        "dc_sections",
+        "selected_dc_geometry_type",
+        "selected_dc_entity",
+        "selected_dc_condition",
+    )
+    def change_dc_entries(
+        self,
+        dc_sections,
+        selected_dc_geometry_type,
+        selected_dc_entity,
+        selected_dc_condition,
+        **kwargs,
+    ):
+        """Reaction to change of state.dc_sections or the design condition
+        selection."""
+        self.set_dc_entries(
+            dc_sections,
+            selected_dc_geometry_type,
+            selected_dc_entity,
+            selected_dc_condition,
+        )
+        # re-render the v-once view mode tables only for a new selection:
+        # the section content is edited in edit mode, where they are not
+        # shown
+        if not self.state.modified_keys.isdisjoint(
+            ["selected_dc_geometry_type", "selected_dc_entity", "selected_dc_condition"]
+        ):
+            self.state.view_version += 1
+
     @change("selected_dc_entity")
     def change_selected_dc_entity(self, selected_dc_entity, **kwargs):
         """Reaction to change of state.selected_dc_entity."""
@@ -1247,6 +1496,40 @@ class FourCWebServer:
         # update the pyvista local view
         self.ctrl.view_update()
 
+    @change("result_description_section", "selected_result_description_id")
+    def change_result_description_param_entries(
+        self, result_description_section, selected_result_description_id, **kwargs
+    ):
+        """Reaction to change of state.result_description_section or
+        state.selected_result_description_id."""
+        self.state.result_description_param_entries = self.get_entries(
+            result_description_section, selected_result_description_id, "PARAMETERS"
+        )
+        self.state.result_description_param_kinds = self.get_kinds(
+            result_description_section, selected_result_description_id, "PARAMETERS"
+        )
+
+    @change(
+        "result_description_section",
+        "selected_result_description_id",
+        "selected_result_description_param",
+    )
+    def change_result_description_param_fields(
+        self,
+        result_description_section,
+        selected_result_description_id,
+        selected_result_description_param,
+        **kwargs,
+    ):
+        """Reaction to change of state.result_description_section or the
+        result description parameter selection."""
+        self.state.result_description_param_fields = self.get_fields(
+            result_description_section,
+            selected_result_description_id,
+            "PARAMETERS",
+            selected_result_description_param,
+        )
+
     @change("selected_funct")
     def change_selected_funct(self, selected_funct, **kwargs):
         """Reaction to change of state.selected_funct."""
@@ -1305,6 +1588,10 @@ class FourCWebServer:
         ):  # after edit mode we are again in view mode
             self.convert_string2num_all_sections()
 
+            # converted values have to be shown in the v-once view mode
+            # tables
+            self.state.view_version += 1
+
             # for now we don't convert the function section, because it
             # works itself with strings, e.g.
             # 'SYMBOLIC_FUNCTION_OF_SPACE_TIME' is a string even if it
@@ -1431,8 +1718,9 @@ class FourCWebServer:
             self.state.input_error_dict = {}
         except ValidationError as exc:
             self.state.input_error_dict = parse_validation_error_text(
-                str(exc.args[0])
-            )  # exc.args[0] is the error message
+                str(exc.args[0]),  # exc.args[0] is the error message
+                max_error_length=MAX_ERROR_MESSAGE_LENGTH,
+            )
             return False
 
     def on_leave_edit_field(self):
@@ -1458,6 +1746,137 @@ class FourCWebServer:
             self.state.result_description_section
         )
 
+    def set_dc_entries(
+        self,
+        dc_sections,
+        selected_dc_geometry_type,
+        selected_dc_entity,
+        selected_dc_condition,
+    ):
+        """Sets the (key, value) entries of the selected design condition
+        entity and of the selected condition (including the kinds of the
+        condition values).
+
+        Args:
+            dc_sections (dict): design conditions state variable.
+            selected_dc_geometry_type (str | None): selected geometry type.
+            selected_dc_entity (str | None): selected entity.
+            selected_dc_condition (str | None): selected condition.
+        """
+        self.state.dc_entries = self.get_entries(
+            dc_sections, selected_dc_geometry_type, selected_dc_entity
+        )
+        # condition entries with the kind of the value as third element
+        self.state.dc_condition_entries = [
+            [k, v, self.get_value_kind(v)]
+            for k, v in self.get_entries(
+                dc_sections,
+                selected_dc_geometry_type,
+                selected_dc_entity,
+                selected_dc_condition,
+            )
+        ]
+
+    @staticmethod
+    def get_entries(section, *keys):
+        """Get the (key, value) entries of a nested dict within a section, to
+        be iterated over on the client-side.
+
+        Args:
+            section (dict): section state variable.
+            *keys (str | None): keys leading to the nested dict.
+        Returns:
+            list: [key, value] entries of the nested dict (empty if the
+            nested dict does not exist).
+        """
+        for key in keys:
+            section = section.get(key) if isinstance(section, dict) else None
+        if not isinstance(section, dict):
+            return []
+        return [[k, v] for k, v in section.items()]
+
+    @staticmethod
+    def get_value_kind(value):
+        """Get the kind of a (parameter) value, determining how it is
+        displayed and edited on the client-side.
+
+        Args:
+            value: considered value.
+        Returns:
+            str | None: "list", "dict" or "scalar" (None for None values).
+        """
+        if value is None:
+            return None
+        if isinstance(value, list):
+            return "list"
+        if isinstance(value, dict):
+            return "dict"
+        return "scalar"
+
+    @classmethod
+    def get_kinds(cls, section, *keys):
+        """Get the kinds of the values of a nested dict within a section.
+
+        Args:
+            section (dict): section state variable.
+            *keys (str | None): keys leading to the nested dict.
+        Returns:
+            dict: kind (see get_value_kind) for each key of the nested dict.
+        """
+        return {k: cls.get_value_kind(v) for k, v in cls.get_entries(section, *keys)}
+
+    @classmethod
+    def get_fields(cls, section, *keys):
+        """Get the keys and the value kinds of a nested dict within a section
+        as parallel arrays, to be iterated over by index on the client-side.
+
+        Args:
+            section (dict): section state variable.
+            *keys (str | None): keys leading to the nested dict.
+        Returns:
+            dict: keys ("keys") and kinds ("kinds", see get_value_kind) of
+            the entries of the nested dict.
+        """
+        entries = cls.get_entries(section, *keys)
+        return {
+            "keys": [k for k, _ in entries],
+            "kinds": [cls.get_value_kind(v) for _, v in entries],
+        }
+
+    @staticmethod
+    def get_relationships_view(materials_section, selected_material):
+        """Get the display strings of the relationships (linked materials and
+        master material) of the selected material.
+
+        Args:
+            materials_section (dict): materials state variable.
+            selected_material (str | None): selected material.
+        Returns:
+            dict: display strings for the linked materials ("linked") and
+            the master material ("master").
+        """
+        if selected_material not in materials_section:
+            return {"linked": "", "master": ""}
+
+        relationships = materials_section[selected_material]["RELATIONSHIPS"]
+        return {
+            "linked": ", ".join(map(str, relationships["LINKED MATERIALS"])),
+            "master": str(relationships["MASTER MATERIAL"]),
+        }
+
+    @staticmethod
+    def is_dc_ready(dc_sections, selected_dc_geometry_type):
+        """Checks whether there are design condition entities to be displayed
+        for the selected geometry type.
+
+        Args:
+            dc_sections (dict): design conditions state variable.
+            selected_dc_geometry_type (str | None): selected geometry type.
+        Returns:
+            bool: True if the selected geometry type contains entities.
+        """
+        return bool(dc_sections) and bool(dc_sections.get(selected_dc_geometry_type))
+
     def determine_master_mat_ind_for_material(self, material):
         """Determines the real master/source material of a material. Accounts
         for CLONING MATERIAL MAP by going one step further and checking for the
@@ -1,6 +1,5 @@
 """Specifies the GUI layout."""
 
-import plotly
 from pyvista.trame.ui import plotter_ui
 
 from fourc_webviewer.input_file_utils.fourc_yaml_file_visualization import (
@@ -16,7 +15,68 @@ else:
     from trame.ui.vuetify3 import SinglePageWithDrawerLayout
     from trame.widgets import vuetify3 as vuetify
     from trame_vuetify.widgets.vuetify3 import HtmlElement
-from trame.widgets import html, plotly
+from trame.ui.html import DivLayout
+from trame.widgets import client, html, plotly
+
+# client-side filter for the autocomplete items: looks up the lowercase item
+# titles precomputed on the server (state variable schema_lowercase_index)
+# instead of lowercasing all items on every keystroke
+AUTOCOMPLETE_FILTER = (
+    "(value, query) => !query || (schema_lowercase_index[value] ?? String(value).toLowerCase()).includes(query.toLowerCase())",
+)
+
+# client-side debounce helper: a callback is only executed after no further
+# call with the same key happened for the given delay (in ms)
+DEBOUNCE_SCRIPT = """
+window.fourcDebounce = (() => {
+  const timers = {};
+  const callbacks = {};
+  const debounce = (key, callback, delay = 200) => {
+    window.clearTimeout(timers[key]);
+    callbacks[key] = callback;
+    timers[key] = window.setTimeout(() => debounce.flush(key), delay);
+  };
+  // executes the pending callback with the given key immediately
+  debounce.flush = (key) => {
+    const callback = callbacks[key];
+    window.clearTimeout(timers[key]);
+    delete callbacks[key];
+    if (callback) {
+      callback();
+    }
+  };
+  return debounce;
+})();
+"""
+
+
+def _debounced_flush(state_name):
+    """Client-side expression flushing a (nested) state variable to the
+    server, debounced over consecutive edits (e.g. keystrokes), so that the
+    whole section is only sent once the user paused typing.
+
+    Args:
+        state_name (str): name of the state variable to be flushed.
+
+    Returns:
+        str: client-side expression.
+    """
+    return f"window.fourcDebounce('{state_name}', () => flushState('{state_name}'))"
+
+
+def _flush_on_blur(state_name):
+    """Client-side expression flushing a pending debounced state variable
+    (see _debounced_flush) as soon as its input loses the focus, so that a
+    subsequent click (e.g. export, change of the selection) does not act on a
+    stale server state.
+
+    Args:
+        state_name (str): name of the state variable to be flushed.
+
+    Returns:
+        str: client-side expression for the update:focused event.
+    """
+    return f"$event || window.fourcDebounce.flush('{state_name}')"
 
 
 class VFileInput(HtmlElement):
@@ -564,6 +624,7 @@ def _functions_panel(server):
                 v_for=(
                     "[param_key, param_val] of Object.entries(funct_section[selected_funct][selected_funct_item])",
                 ),
+                key="param_key",
                 classes="d-flex align-center ga-3 mb-5 pl-5 w-full",
             ):
                 html.P(
@@ -600,17 +661,78 @@ def _top_row(server):
             html.Span("Add Section:", classes="text-h6 font-weight-medium mr-3")
             vuetify.VAutocomplete(
                 v_model=("add_section",),
-                items=(
-                    "Object.keys(json_schema['properties']).filter(key => !new Set(['MATERIALS', 'TITLE', 'CLONING MATERIAL MAP', 'RESULT DESCRIPTION']).has(key) && !(['DESIGN', 'TOPOLOGY', 'ELEMENTS', 'NODE', 'FUNCT', 'GEOMETRY'].some(n => key.includes(n))))",
-                ),
+                items=("addable_section_names",),
                 dense=True,
                 solo=True,
                 filterable=True,
+                custom_filter=AUTOCOMPLETE_FILTER,
                 classes="ma-0 flex-grow-0",
                 style="width: 200px;",
             )
 
 
+def _scalar_editor(server, v_model, property_schema, item_error=None):
+    """Editor layout for a single-value property of a general section,
+    depending on its type within the json schema.
+
+    Args:
+        server (trame_server.core.Server): Trame server
+        v_model (str): expression of the edited value.
+        property_schema (str): expression of the json schema of the
+            edited property.
+        item_error (str | None): expression of the input error message of
+            the edited property. If None, errors are not highlighted.
+    """
+    error_kwargs = {}
+    if item_error is not None:
+        error_kwargs = {
+            "color": f"{item_error} && error",
+            "bg_color": (f"{item_error} ? 'rgba(255, 0, 0, 0.2)' : ''",),
+            "error_messages": (item_error,),
+        }
+
+    # if item is a string, number or integer -> use VTextField
+    vuetify.VTextField(
+        v_model=(v_model,),
+        v_if=(
+            f"['string', 'number', 'integer'].includes({property_schema}?.['type']) "
+            f"&& !{property_schema}?.['enum']",
+        ),
+        blur=server.controller.on_leave_edit_field,
+        update_modelValue="flushState('general_sections')",  # this is required in order to flush the state changes correctly to the server, as our passed on v-model is a nested variable
+        classes="w-80 pb-1",
+        dense=True,
+        **error_kwargs,
+    )
+    # if item is a boolean -> use VSwitch
+    with html.Div(
+        v_if=(f"{property_schema}?.['type'] === 'boolean'",),
+        classes="d-flex align-center justify-center",
+    ):
+        vuetify.VSwitch(
+            v_model=(v_model,),
+            classes="mt-4",
+            update_modelValue="flushState('general_sections')",
+            class_="mx-100",
+            dense=True,
+            color="primary",
+        )
+    # if item is an enum -> use VAutocomplete
+    vuetify.VAutocomplete(
+        v_model=(v_model,),
+        v_if=(f"{property_schema}?.['enum']",),
+        update_modelValue="flushState('general_sections')",
+        # bind the enum array as items
+        items=(f"{property_schema}['enum']",),
+        dense=True,
+        solo=True,
+        filterable=True,
+        custom_filter=AUTOCOMPLETE_FILTER,
+        classes="w-80 pb-1",
+        **error_kwargs,
+    )
+
+
 def _prop_value_table(server):
     """Table (property - value) layout (for general sections)."""
 
@@ -635,10 +757,13 @@ def _prop_value_table(server):
                 v_if=(
                     "general_sections[selected_main_section_name] && general_sections[selected_main_section_name][selected_section_name] && Object.keys(general_sections[selected_main_section_name][selected_section_name]).length >= 1",
                 ),
-                v_for=(
-                    "[item_key, item_val] of Object.entries(general_sections[selected_main_section_name]?.[selected_section_name] || {})",
-                ),
+                v_for=("[item_key, item_val] of general_section_entries",),
                 key="item_key",
+                # only re-render the row if its (edited) value, the mode,
+                # the input errors or the selected section changed
+                v_memo=(
+                    "[item_key, general_sections[selected_main_section_name]?.[selected_section_name]?.[item_key], edit_mode, input_error_dict, selected_section_name]",
+                ),
             ):
                 with html.Td(classes="text-center pa-0", style="position: relative;"):
                     with vuetify.VBtn(
@@ -676,70 +801,11 @@ def _prop_value_table(server):
                     classes="text-center w-50",
                 ):
                     item_error = "input_error_dict[selected_main_section_name]?.[item_key] || input_error_dict[selected_main_section_name + '~1' + selected_subsection_name]?.[item_key]"
-                    # if item is a string, number or integer -> use VTextField
-                    vuetify.VTextField(
-                        v_model=(
-                            "general_sections[selected_main_section_name][selected_section_name][item_key]",  # binding item_val directly does not work, since Object.entries(...) creates copies for the mutable objects
-                        ),
-                        v_if=(
-                            "(json_schema['properties']?.[selected_section_name]?.['properties']?.[item_key]?.['type'] == 'string' "
-                            "|| json_schema['properties']?.[selected_section_name]?.['properties']?.[item_key]?.['type'] == 'number' "
-                            "|| json_schema['properties']?.[selected_section_name]?.['properties']?.[item_key]?.['type'] == 'integer')"
-                            "&& !json_schema['properties']?.[selected_section_name]?.['properties']?.[item_key]?.['enum']"
-                        ),
-                        blur=server.controller.on_leave_edit_field,
-                        update_modelValue="flushState('general_sections')",  # this is required in order to flush the state changes correctly to the server, as our passed on v-model is a nested variable
-                        classes="w-80 pb-1",
-                        dense=True,
-                        color=f"{item_error} && error",
-                        bg_color=(f"{item_error} ? 'rgba(255, 0, 0, 0.2)' : ''",),
-                        error_messages=(
-                            f"{item_error}?.length > 100 ? {item_error}?.slice(0, 97)+' ...' : {item_error}",
-                        ),
-                    )
-                    # if item is a boolean -> use VSwitch
-                    with html.Div(
-                        v_if=(
-                            "json_schema['properties']?.[selected_section_name]?.['properties']?.[item_key]?.['type'] === 'boolean'"
-                        ),
-                        classes="d-flex align-center justify-center",
-                    ):
-                        vuetify.VSwitch(
-                            v_model=(
-                                "general_sections[selected_main_section_name][selected_section_name][item_key]"
-                            ),
-                            classes="mt-4",
-                            update_modelValue="flushState('general_sections')",
-                            class_="mx-100",
-                            dense=True,
-                            color="primary",
-                        )
-                    # if item is an enum -> use VAutocomplete
-                    (
-                        vuetify.VAutocomplete(
-                            v_model=(
-                                "general_sections[selected_main_section_name]"
-                                "[selected_section_name][item_key]"
-                            ),
-                            v_if=(
-                                "json_schema['properties']?.[selected_section_name]"
-                                "?.['properties']?.[item_key]?.['enum']"
-                            ),
-                            update_modelValue="flushState('general_sections')",
-                            # bind the enum array as items
-                            items=(
-                                "json_schema['properties'][selected_section_name]['properties'][item_key]['enum']",
-                            ),
-                            dense=True,
-                            solo=True,
-                            filterable=True,
-                            classes="w-80 pb-1",
-                            color=f"{item_error} && error",
-                            bg_color=(f"{item_error} ? 'rgba(255, 0, 0, 0.2)' : ''",),
-                            error_messages=(
-                                f"{item_error}?.length > 100 ? {item_error}?.slice(0, 97)+' ...' : {item_error}",
-                            ),
-                        ),
+                    _scalar_editor(
+                        server,
+                        v_model="general_sections[selected_main_section_name][selected_section_name][item_key]",  # binding item_val directly does not work, since the entries are computed on the server
+                        property_schema="json_schema['properties']?.[selected_section_name]?.['properties']?.[item_key]",
+                        item_error=item_error,
                     )
             with html.Tr(
                 v_if=("edit_mode == all_edit_modes['edit_mode']",),
@@ -770,6 +836,7 @@ def _prop_value_table(server):
                         dense=True,
                         solo=True,
                         filterable=True,
+                        custom_filter=AUTOCOMPLETE_FILTER,
                         classes="pb-1 ml-16",
                     )
                 html.Td(
@@ -781,62 +848,11 @@ def _prop_value_table(server):
                     v_if="edit_mode == all_edit_modes['edit_mode']",
                     classes="text-center w-50",
                 ):
-                    vuetify.VTextField(
-                        v_model=("add_value",),
-                        v_if=(
-                            "(json_schema['properties']?.[selected_section_name]?.['properties']?.[add_key]?.['type'] == 'string' "
-                            "|| json_schema['properties']?.[selected_section_name]?.['properties']?.[add_key]?.['type'] == 'number' "
-                            "|| json_schema['properties']?.[selected_section_name]?.['properties']?.[add_key]?.['type'] == 'integer')"
-                            "&& !json_schema['properties']?.[selected_section_name]?.['properties']?.[add_key]?.['enum']"
-                        ),
-                        blur=server.controller.on_leave_edit_field,
-                        update_modelValue="flushState('general_sections')",  # this is required in order to flush the state changes correctly to the server, as our passed on v-model is a nested variable
-                        classes="w-80 pb-1",
-                        dense=True,
-                        # If we will add errors for this later
-                        # color=f"{item_error} && error",
-                        # bg_color=(f"{item_error} ? 'rgba(255, 0, 0, 0.2)' : ''",),
-                        # error_messages=(
-                        #     f"{item_error}?.length > 100 ? {item_error}?.slice(0, 97)+' ...' : {item_error}",
-                        # ),
-                    )
-                    # if item is a boolean -> use VSwitch
-                    with html.Div(
-                        v_if=(
-                            "json_schema['properties']?.[selected_section_name]?.['properties']?.[add_key]?.['type'] === 'boolean'"
-                        ),
-                        classes="d-flex align-center justify-center",
-                    ):
-                        vuetify.VSwitch(
-                            v_model=("add_value"),
-                            classes="mt-4",
-                            update_modelValue="flushState('general_sections')",
-                            class_="mx-100",
-                            dense=True,
-                            color="primary",
-                        )
-                    (
-                        vuetify.VAutocomplete(
-                            v_model=("add_value"),
-                            v_if=(
-                                "json_schema['properties']?.[selected_section_name]"
-                                "?.['properties']?.[add_key]?.['enum']"
-                            ),
-                            update_modelValue="flushState('general_sections')",
-                            # bind the enum array as items
-                            items=(
-                                "json_schema['properties'][selected_section_name]['properties'][add_key]['enum']",
-                            ),
-                            dense=True,
-                            solo=True,
-                            filterable=True,
-                            classes="w-80 pb-1",
-                            # color=f"{item_error} && error",
-                            # bg_color=(f"{item_error} ? 'rgba(255, 0, 0, 0.2)' : ''",),
-                            # error_messages=(
-                            #     f"{item_error}?.length > 100 ? {item_error}?.slice(0, 97)+' ...' : {item_error}",
-                            # ),
-                        ),
+                    # If we will add errors for this later: pass item_error
+                    _scalar_editor(
+                        server,
+                        v_model="add_value",
+                        property_schema="json_schema['properties']?.[selected_section_name]?.['properties']?.[add_key]",
                     )
 
 
@@ -885,9 +901,7 @@ def _materials_panel():
                 classes="ga-3 mb-5 pl-5 pr-5 w-full",
                 v_if=("edit_mode ==  all_edit_modes['view_mode']",),
                 v_text=(
-                    "json_schema?.properties?.MATERIALS?.items?.oneOf?"
-                    ".find(v => v.properties?.[materials_section[selected_material]?.TYPE])?.properties?"
-                    ".[materials_section[selected_material]?.TYPE]?.description || 'Error on material description'",
+                    "material_types_index[materials_section[selected_material]?.TYPE]?.description || 'Error on material description'",
                 ),
                 style="color: #999;",
             )
@@ -904,9 +918,7 @@ def _materials_panel():
                 ):
                     html.Span("LINKED MATERIALS: ")
                     html.Span(
-                        v_text=(
-                            "materials_section[selected_material]['RELATIONSHIPS']['LINKED MATERIALS']",
-                        ),
+                        v_text=("relationships_view.linked",),
                         classes="",
                     )
                 with html.Div(
@@ -914,52 +926,49 @@ def _materials_panel():
                 ):
                     html.Span("MASTER MATERIAL: ")
                     html.Span(
-                        v_text=(
-                            "materials_section[selected_material]['RELATIONSHIPS']['MASTER MATERIAL']",
-                        ),
+                        v_text=("relationships_view.master",),
                         classes="",
                     )
             # show material parameters (as a table with different
             # view<->edit mode structures)
             html.P("PARAMETERS: ", classes="text-h6 pl-5 mb-1")
             # show table of parameters in view mode
-            with vuetify.VTable(
-                v_if=("edit_mode ==  all_edit_modes['view_mode']",), classes="mx-3"
+            with html.Div(
+                v_if=("edit_mode ==  all_edit_modes['view_mode']",),
+                key="view_version",
             ):
-                with html.Thead():
-                    with html.Tr():
-                        html.Th(
-                            "Property",
-                            classes="text-center font-weight-bold",
-                        )
-                        html.Th(
-                            "Value",
-                            classes="text-center font-weight-bold",
-                            style="width: 50%;",
-                        )
-                with html.Tbody():
-                    with html.Tr(
-                        v_for=(
-                            "[param_key, param_val] of Object.entries(materials_section[selected_material]?.['PARAMETERS'] || {})",
-                        ),
-                        classes="text-center",
-                    ):
-                        with html.Td(classes="text-center"):
-                            with vuetify.VTooltip(location="bottom"):
-                                with html.Template(v_slot_activator="{ props }"):
-                                    html.P(v_text=("param_key",), v_bind="props")
-                                html.P(
-                                    v_text=(
-                                        "json_schema?.properties?.MATERIALS?.items?.oneOf?"
-                                        ".find(v => v.properties?.[materials_section[selected_material]?.TYPE])?"
-                                        ".properties?.[materials_section[selected_material]?.TYPE]?.properties?"
-                                        ".[param_key]?.description || 'Error on parameter description'",
-                                    ),
-                                    style="max-width: 450px;",
-                                )
-                        html.Td(
-                            v_text=("param_val",),
-                        )
+                # read-only table: rendered once until the key changes
+                with vuetify.VTable(v_once=True, classes="mx-3"):
+                    with html.Thead():
+                        with html.Tr():
+                            html.Th(
+                                "Property",
+                                classes="text-center font-weight-bold",
+                            )
+                            html.Th(
+                                "Value",
+                                classes="text-center font-weight-bold",
+                                style="width: 50%;",
+                            )
+                    with html.Tbody():
+                        with html.Tr(
+                            v_for=("[param_key, param_val] of material_param_entries",),
+                            key="param_key",
+                            classes="text-center",
+                        ):
+                            with html.Td(classes="text-center"):
+                                with vuetify.VTooltip(location="bottom"):
+                                    with html.Template(v_slot_activator="{ props }"):
+                                        html.P(v_text=("param_key",), v_bind="props")
+                                    html.P(
+                                        v_text=(
+                                            "material_types_index[materials_section[selected_material]?.TYPE]?.parameters?.[param_key] || 'Error on parameter description'",
+                                        ),
+                                        style="max-width: 450px;",
+                                    )
+                            html.Td(
+                                v_text=("param_val",),
+                            )
             with html.Div(
                 v_if=(
                     "edit_mode ==  all_edit_modes['edit_mode'] && Object.keys(materials_section[selected_material]['PARAMETERS']).length > 0",
@@ -977,7 +986,7 @@ def _materials_panel():
                 # dict) -> VTextField
                 vuetify.VTextField(
                     v_if=(
-                        "materials_section[selected_material]['PARAMETERS'][selected_material_param]!== null && typeof materials_section[selected_material]['PARAMETERS'][selected_material_param] !== 'object' && !Array.isArray(materials_section[selected_material]['PARAMETERS'][selected_material_param])",
+                        "material_param_kinds[selected_material_param] === 'scalar'",
                     ),
                     v_model=(
                         "materials_section[selected_material]['PARAMETERS'][selected_material_param]",  # binding item_val directly does not work, since Object.entries(...) creates copies for the mutable objects
@@ -989,9 +998,7 @@ def _materials_panel():
                 )
                 # if parameter is list -> VTextField
                 with vuetify.VList(
-                    v_if=(
-                        "materials_section[selected_material]['PARAMETERS'][selected_material_param]!== null && Array.isArray(materials_section[selected_material]['PARAMETERS'][selected_material_param])"
-                    ),
+                    v_if=("material_param_kinds[selected_material_param] === 'list'"),
                 ):
                     with html.Div(
                         v_for=(
@@ -1017,9 +1024,7 @@ def _materials_panel():
                 # show table of modifiable dict parameters if material
                 # parameter is a dict
                 with vuetify.VTable(
-                    v_if=(
-                        "materials_section[selected_material]['PARAMETERS'][selected_material_param]!== null && typeof materials_section[selected_material]['PARAMETERS'][selected_material_param] === 'object' && !Array.isArray(materials_section[selected_material]['PARAMETERS'][selected_material_param])"
-                    ),
+                    v_if=("material_param_kinds[selected_material_param] === 'dict'"),
                     classes="mx-3",
                 ):
                     with html.Thead():
@@ -1035,8 +1040,9 @@ def _materials_panel():
                     with html.Tbody():
                         with html.Tr(
                             v_for=(
-                                "[param_key, param_val] of Object.entries(materials_section[selected_material]['PARAMETERS']?.[selected_material_param] || {})",
+                                "(param_key, param_index) in material_param_fields.keys",
                             ),
+                            key="param_key",
                             classes="text-center",
                         ):
                             html.Td(v_text=("param_key",))
@@ -1045,7 +1051,7 @@ def _materials_panel():
                             # text field
                             with html.Td(
                                 v_if=(
-                                    "materials_section[selected_material]['PARAMETERS'][selected_material_param][param_key]!== null && typeof materials_section[selected_material]['PARAMETERS'][selected_material_param][param_key] !== 'object' && !Array.isArray(materials_section[selected_material]['PARAMETERS'][selected_material_param][param_key])",
+                                    "material_param_fields.kinds[param_index] === 'scalar'",
                                 )
                             ):
                                 vuetify.VTextField(
@@ -1059,7 +1065,7 @@ def _materials_panel():
                             # list | dict -> we don't make it modifiable (currently)
                             html.Td(
                                 v_if=(
-                                    "Array.isArray(materials_section[selected_material]['PARAMETERS'][selected_material_param][param_key]) || typeof materials_section[selected_material]['PARAMETERS'][selected_material_param][param_key] == 'object'",
+                                    "material_param_fields.kinds[param_index] !== 'scalar'",
                                 ),
                                 v_text=(
                                     "materials_section[selected_material]['PARAMETERS'][selected_material_param][param_key]",
@@ -1076,9 +1082,10 @@ def _materials_panel():
             ##################################################
             # View Mode == Edit Mode (currently) #############
             ##################################################
-            with html.Div():
-                # show table of cloning material map items
-                with vuetify.VTable(classes="mx-3"):
+            with html.Div(key="view_version"):
+                # show table of cloning material map items (read-only:
+                # rendered once until the key changes)
+                with vuetify.VTable(v_once=True, classes="mx-3"):
                     with html.Thead():
                         with html.Tr():
                             html.Th(
@@ -1099,7 +1106,8 @@ def _materials_panel():
                             )
                     with html.Tbody():
                         with html.Tr(
-                            v_for=("item in cloning_material_map_section"),
+                            v_for=("item in cloning_material_map_section",),
+                            key="item.id",
                         ):
                             html.Td(
                                 v_text=("item['SRC_FIELD']",),
@@ -1132,50 +1140,44 @@ def _design_conditions_panel():
             v_model=("selected_dc_geometry_type",),
             items=("Object.keys(dc_sections)",),
         )
-        # dropdown for entities
-        vuetify.VSelect(
-            v_if=(
-                "Object.keys(dc_sections).length > 0 && Object.keys(dc_sections[selected_dc_geometry_type]).length > 0",
-            ),
-            v_model=("selected_dc_entity",),
-            items=("Object.keys(dc_sections[selected_dc_geometry_type])",),
-        )
-        with html.Div(
-            v_if=(
-                "Object.keys(dc_sections).length > 0 && Object.keys(dc_sections[selected_dc_geometry_type]).length > 0",
-            ),
-        ):
-            # view mode: show table of property - value
-            with vuetify.VTable(
-                v_if=(
-                    "Object.keys(dc_sections).length > 0 && Object.keys(dc_sections[selected_dc_geometry_type]).length > 0 && edit_mode == all_edit_modes['view_mode']",
-                ),
-                classes="mx-3",
+        # single gate for all elements requiring entities of the selected
+        # geometry (dc_ready is computed on the server)
+        with html.Div(v_if=("dc_ready",)):
+            # dropdown for entities
+            vuetify.VSelect(
+                v_model=("selected_dc_entity",),
+                items=("Object.keys(dc_sections[selected_dc_geometry_type])",),
+            )
+            # view mode: show table of property - value (read-only table:
+            # rendered once until the key changes)
+            with html.Div(
+                v_if=("edit_mode == all_edit_modes['view_mode']",),
+                key="view_version",
             ):
-                with html.Thead():
-                    with html.Tr():
-                        html.Th(
-                            "CONDITION TYPE",
-                            classes="text-center font-weight-bold",
-                        )
-                        html.Th(
-                            "SETTINGS",
-                            classes="text-center font-weight-bold",
-                        )
-                with html.Tbody():
-                    with html.Tr(
-                        v_for=(
-                            "[item_key, item_val] of Object.entries(dc_sections[selected_dc_geometry_type]?.[selected_dc_entity] || {})"
-                        ),
-                    ):
-                        html.Td(
-                            v_text=("item_key",),
-                            classes="text-center",
-                        )
-                        html.Td(
-                            v_text=("item_val",),
-                            classes="text-center",
-                        )
+                with vuetify.VTable(v_once=True, classes="mx-3"):
+                    with html.Thead():
+                        with html.Tr():
+                            html.Th(
+                                "CONDITION TYPE",
+                                classes="text-center font-weight-bold",
+                            )
+                            html.Th(
+                                "SETTINGS",
+                                classes="text-center font-weight-bold",
+                            )
+                    with html.Tbody():
+                        with html.Tr(
+                            v_for=("[item_key, item_val] of dc_entries",),
+                            key="item_key",
+                        ):
+                            html.Td(
+                                v_text=("item_key",),
+                                classes="text-center",
+                            )
+                            html.Td(
+                                v_text=("item_val",),
+                                classes="text-center",
+                            )
 
             # edit mode: add selector for conditions and display the setting
             # items in a property - value table
@@ -1200,8 +1202,9 @@ def _design_conditions_panel():
                     with html.Tbody():
                         with html.Tr(
                             v_for=(
-                                "[item_key, item_val] of Object.entries(dc_sections[selected_dc_geometry_type][selected_dc_entity][selected_dc_condition])"
+                                "[item_key, item_val, item_kind] of dc_condition_entries",
                             ),
+                            key="item_key",
                         ):
                             html.Td(
                                 v_text=("item_key",),
@@ -1210,16 +1213,15 @@ def _design_conditions_panel():
                             # single values (!= dict and != list): show
                             # modifiable text field
                             with html.Td(
-                                v_if=(
-                                    "item_val !== null && !Array.isArray(item_val) && typeof item_val !== 'object'"
-                                ),
+                                v_if=("item_kind === 'scalar'"),
                                 classes="text-center",
                             ):
                                 vuetify.VTextField(
                                     v_model=(
                                         "dc_sections[selected_dc_geometry_type][selected_dc_entity][selected_dc_condition][item_key]",
                                     ),
-                                    update_modelValue="flushState('dc_sections')",
+                                    update_focused=_flush_on_blur("dc_sections"),
+                                    update_modelValue=_debounced_flush("dc_sections"),
                                     classes="mx-10",
                                     dense=True,
                                     hide_details=True,
@@ -1228,7 +1230,7 @@ def _design_conditions_panel():
                             # list of modifiable text fields
                             # modifiable text field
                             with html.Td(
-                                v_if=("item_val !== null && Array.isArray(item_val) "),
+                                v_if=("item_kind === 'list'"),
                                 classes="text-center",
                             ):
                                 with vuetify.VList():
@@ -1250,7 +1252,12 @@ def _design_conditions_panel():
                                             ),
                                             dense=True,
                                             hide_details=True,
-                                            update_modelValue="flushState('dc_sections')",
+                                            update_focused=_flush_on_blur(
+                                                "dc_sections"
+                                            ),
+                                            update_modelValue=_debounced_flush(
+                                                "dc_sections"
+                                            ),
                                             classes="mx-10",
                                         )
 
@@ -1289,7 +1296,10 @@ def _result_description_panel():
                         v_model=(
                             "result_description_section[selected_result_description_id]['FIELD']",  # binding item_val directly does not work, since Object.entries(...) creates copies for the mutable objects
                         ),
-                        update_modelValue="flushState('result_description_section')",  # this is required in order to flush the state changes correctly to the server, as our passed on v-model is a nested variable
+                        update_focused=_flush_on_blur("result_description_section"),
+                        update_modelValue=_debounced_flush(
+                            "result_description_section"
+                        ),  # this is required in order to flush the state changes correctly to the server, as our passed on v-model is a nested variable
                         classes="mx-10",
                         dense=True,
                         hide_details=True,
@@ -1298,32 +1308,28 @@ def _result_description_panel():
             # show result description parameters (as a table with different
             # view<->edit mode structures)
             html.P("PARAMETERS: ", classes="text-h6 pl-5 mb-1")
-            # show table of parameters in view mode
-            with vuetify.VTable(
-                v_if=("edit_mode ==  all_edit_modes['view_mode']",), classes="mx-3"
+            # show table of parameters in view mode: virtualized (only the
+            # visible rows are rendered), scrollable if there are many
+            # parameters
+            with vuetify.VDataTableVirtual(
+                v_if=("edit_mode ==  all_edit_modes['view_mode']",),
+                items=("result_description_param_entries",),
+                # the items are [key, value] entries: the column keys are the
+                # array indices
+                headers=(
+                    "[{title: 'Property', key: '0', align: 'center', sortable: false}, {title: 'Value', key: '1', align: 'center', sortable: false}]",
+                ),
+                header_props=("{class: 'font-weight-bold'}",),
+                item_value="0",
+                height=(
+                    "result_description_param_entries.length > 10 ? 500 : undefined",
+                ),
+                fixed_header=True,
+                classes="mx-3",
             ):
-                with html.Thead():
-                    with html.Tr():
-                        html.Th(
-                            "Property",
-                            classes="text-center font-weight-bold",
-                        )
-                        html.Th(
-                            "Value",
-                            classes="text-center font-weight-bold",
-                        )
-                with html.Tbody():
-                    with html.Tr(
-                        v_for=(
-                            "[param_key, param_val] of Object.entries(result_description_section[selected_result_description_id]?.['PARAMETERS'] || {})",
-                        ),
-                        classes="text-center",
-                    ):
-                        html.Td(v_text=("param_key",))
-                        html.Td(
-                            v_if=("edit_mode ==  all_edit_modes['view_mode']",),
-                            v_text=("param_val",),
-                        )
+                # display values as text (also for non-scalar values)
+                with html.Template(raw_attrs=['v-slot:item.1="{ value }"']):
+                    html.Span(v_text=("value",))
 
         with html.Div(
             v_if=(
@@ -1342,12 +1348,13 @@ def _result_description_panel():
             # dict) -> VTextField
             vuetify.VTextField(
                 v_if=(
-                    "result_description_section[selected_result_description_id]['PARAMETERS'][selected_result_description_param]!== null && typeof result_description_section[selected_result_description_id]['PARAMETERS'][selected_result_description_param] !== 'object' && !Array.isArray(result_description_section[selected_result_description_id]['PARAMETERS'][selected_result_description_param])",
+                    "result_description_param_kinds[selected_result_description_param] === 'scalar'",
                 ),
                 v_model=(
                     "result_description_section[selected_result_description_id]['PARAMETERS'][selected_result_description_param]",
                 ),
-                update_modelValue="flushState('result_description_section')",
+                update_focused=_flush_on_blur("result_description_section"),
+                update_modelValue=_debounced_flush("result_description_section"),
                 classes="mx-10",
                 dense=True,
                 hide_details=True,
@@ -1355,7 +1362,7 @@ def _result_description_panel():
             # if parameter is list -> VTextField
             with vuetify.VList(
                 v_if=(
-                    "result_description_section[selected_result_description_id]['PARAMETERS'][selected_result_description_param]!== null && Array.isArray(result_description_section[selected_result_description_id]['PARAMETERS'][selected_result_description_param])"
+                    "result_description_param_kinds[selected_result_description_param] === 'list'"
                 ),
             ):
                 with html.Div(
@@ -1376,14 +1383,17 @@ def _result_description_panel():
                         ),
                         dense=True,
                         hide_details=True,
-                        update_modelValue="flushState('result_description_section')",  # this is required in order to flush the state changes correctly to the server, as our passed on v-model is a nested variable
+                        update_focused=_flush_on_blur("result_description_section"),
+                        update_modelValue=_debounced_flush(
+                            "result_description_section"
+                        ),  # this is required in order to flush the state changes correctly to the server, as our passed on v-model is a nested variable
                         classes="mx-10",
                     )
             # show table of modifiable dict parameters if material
             # parameter is a dict
             with vuetify.VTable(
                 v_if=(
-                    "result_description_section[selected_result_description_id]['PARAMETERS'][selected_result_description_param]!== null && typeof result_description_section[selected_result_description_id]['PARAMETERS'][selected_result_description_param] === 'object' && !Array.isArray(result_description_section[selected_result_description_id]['PARAMETERS'][selected_result_description_param])"
+                    "result_description_param_kinds[selected_result_description_param] === 'dict'"
                 ),
                 classes="mx-3",
             ):
@@ -1400,8 +1410,9 @@ def _result_description_panel():
                 with html.Tbody():
                     with html.Tr(
                         v_for=(
-                            "[param_key, param_val] of Object.entries(result_description_section[selected_result_description_id]['PARAMETERS']?.[selected_result_description_param] || {})",
+                            "(param_key, param_index) in result_description_param_fields.keys",
                         ),
+                        key="param_key",
                         classes="text-center",
                     ):
                         html.Td(v_text=("param_key",))
@@ -1410,21 +1421,26 @@ def _result_description_panel():
                         # text field
                         with html.Td(
                             v_if=(
-                                "result_description_section[selected_result_description_id]['PARAMETERS'][selected_result_description_param][param_key]!== null && typeof result_description_section[selected_result_description_id]['PARAMETERS'][selected_result_description_param][param_key] !== 'object' && !Array.isArray(result_description_section[selected_result_description_id]['PARAMETERS'][selected_result_description_param][param_key])",
+                                "result_description_param_fields.kinds[param_index] === 'scalar'",
                             )
                         ):
                             vuetify.VTextField(
                                 v_model=(
                                     "result_description_section[selected_result_description_id]['PARAMETERS'][selected_result_description_param][param_key]",
                                 ),
-                                update_modelValue="flushState('result_description_section')",  # this is required in order to flush the state changes correctly to the server, as our passed on v-model is a nested variable
+                                update_focused=_flush_on_blur(
+                                    "result_description_section"
+                                ),
+                                update_modelValue=_debounced_flush(
+                                    "result_description_section"
+                                ),  # this is required in order to flush the state changes correctly to the server, as our passed on v-model is a nested variable
                                 classes="mx-10",
                             )
                         # else if parameter of material parameter is
                         # list | dict -> we don't make it modifiable (currently)
                         html.Td(
                             v_if=(
-                                "Array.isArray(result_description_section[selected_result_description_id]['PARAMETERS'][selected_result_description_param][param_key]) || typeof result_description_section[selected_result_description_id]['PARAMETERS'][selected_result_description_param][param_key] == 'object'",
+                                "result_description_param_fields.kinds[param_index] !== 'scalar'",
                             ),
                             v_text=(
                                 "result_description_section[selected_result_description_id]['PARAMETERS'][selected_result_description_param][param_key]",
@@ -1432,11 +1448,28 @@ def _result_description_panel():
                         )
 
 
+def _panel_template(server, template_name, panel, *args):
+    """Builds a panel layout as separate template and includes it via
+    trame-template, which renders it as own child component. The panel is
+    then only re-rendered if the state variables used by it change.
+
+    Args:
+        server (trame_server.core.Server): Trame server
+        template_name (str): name of the panel template
+        panel (callable): panel layout function
+        *args: arguments passed on to the panel layout function
+    """
+    with DivLayout(server, template_name=template_name, connect_parent=False):
+        panel(*args)
+    client.ServerTemplate(name=template_name)
+
+
 def create_gui(server, render_window):
     """Creates the graphical user interface based on the defined layout
     elements."""
     with SinglePageWithDrawerLayout(server) as layout:
         layout.title.hide()
+        client.Script(DEBOUNCE_SCRIPT)
 
         with layout.toolbar as toolbar:
             toolbar.height = 100
@@ -1453,10 +1486,15 @@ def create_gui(server, render_window):
                 _top_row(server)
                 _sections_dropdown()
                 _prop_value_table(server)
-                _materials_panel()
-                _functions_panel(server)
-                _design_conditions_panel()
-                _result_description_panel()
+                # larger panels as separate child components
+                _panel_template(server, "materials_panel", _materials_panel)
+                _panel_template(server, "functions_panel", _functions_panel, server)
+                _panel_template(
+                    server, "design_conditions_panel", _design_conditions_panel
+                )
+                _panel_template(
+                    server, "result_description_panel", _result_description_panel
+                )
                 vuetify.VBtn(
                     text="DELETE SECTION",
                     classes="mx-auto d-block mt-10",
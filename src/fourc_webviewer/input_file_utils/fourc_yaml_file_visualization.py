@@ -1,13 +1,10 @@
 """Input file visualization."""
 
-import copy
+import functools
 import re
-from pathlib import Path
+from typing import NamedTuple
 
-import lnmmeshio
-import numexpr as ne
 import numpy as np
-import plotly.express as px
 from loguru import logger
 
 from fourc_webviewer.input_file_utils.io_utils import (
@@ -17,14 +14,38 @@ from fourc_webviewer.input_file_utils.io_utils import (
 # functional expressions / constants known by 4C, that are replaced by the numpy counterpart during evaluation
 DEF_FUNCT = ["exp", "sqrt", "log", "sin", "cos", "tan", "heaviside", "pi"]
 
+# names within functional expressions which are no function variables
+_RESERVED_NAMES = frozenset(DEF_FUNCT) | {"t", "x", "y", "z"}
+
+# precompiled regular expressions for parsing / rewriting functional
+# expressions (the exponent markers of numbers such as 1e-3 are no names)
+_VAR_NAME_RE = re.compile(r"(?<![0-9.])[A-Za-z_]+")
+_HEAVISIDE_RE = re.compile(r"heaviside\(([^),]+)\)")
+_HEAVISIDE_WITH_VALUE_RE = re.compile(r"heaviside\(([^),]+),\s*([^)]+)\)")
+
+
+class LinearInterpolation(NamedTuple):
+    """Definition of a linearinterpolation function variable, evaluated
+    directly via np.interp instead of a functional expression."""
+
+    times: tuple
+    values: tuple
+
+
+class MultiFunction(NamedTuple):
+    """Definition of a multifunction function variable, evaluating only the
+    functional expression of the active time interval."""
+
+    times: tuple
+    descriptions: tuple
+
 
 def get_variable_names_in_funct_expression(funct_expression: str):
     """Returns all variable names present in a functional expression, using
     regular expressions."""
-    vars_found = re.findall(r"[A-Za-z_]+", funct_expression)
-    return [
-        v for v in vars_found if v not in DEF_FUNCT and v not in ["t", "x", "y", "z"]
-    ]
+    # dict.fromkeys: remove duplicates while keeping the order of occurrence
+    vars_found = dict.fromkeys(_VAR_NAME_RE.findall(funct_expression))
+    return [v for v in vars_found if v not in _RESERVED_NAMES]
 
 
 def function_plot_figure(state_data):
@@ -37,71 +58,69 @@ def function_plot_figure(state_data):
         plotly.graph_objects._figure.Figure: Figure to be plotted
     """
 
+    # nested state lookups used throughout the figure construction
+    funct_plot = state_data.funct_plot
+    funct_section_item = state_data.funct_section[state_data.selected_funct]
+    funct_item = funct_section_item[state_data.selected_funct_item]
+
     # check whether any of the values within the function plot settings
     # is None type (can happen temporarily while changing the values): then write 0 instead
     # of it for the figure plot
-    for item_key, item_val in state_data.funct_plot.items():
-        if item_val != 0.0 and not item_val:
-            state_data.funct_plot[item_key] = 0.0
+    funct_plot_fixes = {
+        item_key: 0.0
+        for item_key, item_val in funct_plot.items()
+        if item_val != 0.0 and not item_val
+    }
+    if funct_plot_fixes:
+        funct_plot.update(funct_plot_fixes)
 
     # check if the function is None type (can happen temporarily while
     # changing the values): then write 0 instead of it for the figure
     # plot
-    if (
-        "COMPONENT"
-        in state_data.funct_section[state_data.selected_funct][
-            state_data.selected_funct_item
-        ]
-    ):
-        function_copy = copy.deepcopy(
-            state_data.funct_section[state_data.selected_funct][
-                state_data.selected_funct_item
-            ]["SYMBOLIC_FUNCTION_OF_SPACE_TIME"]
-        )
-    elif (
-        "VARIABLE"
-        in state_data.funct_section[state_data.selected_funct][
-            state_data.selected_funct_item
-        ]
-    ):
-        function_copy = construct_funct_string_from_variable_data(
-            variable_name=state_data.funct_section[state_data.selected_funct][
-                state_data.selected_funct_item
-            ]["NAME"],
-            funct_section_item=state_data.funct_section[state_data.selected_funct],
+    if "COMPONENT" in funct_item:
+        # the expression is an immutable string: no copy required
+        function_copy = funct_item["SYMBOLIC_FUNCTION_OF_SPACE_TIME"]
+        variable_names = get_variable_names_in_funct_expression(
+            funct_expression=function_copy or ""
         )
+    elif "VARIABLE" in funct_item:
+        # plot the variable itself
+        function_copy = funct_item["NAME"]
+        variable_names = [function_copy]
     if not function_copy:
         function_copy = "0.0"
 
-    # construct function strings for the variables to replace them into
-    # the function later on
-    variable_funct_strings = {
-        k: construct_funct_string_from_variable_data(
-            variable_name=k,
-            funct_section_item=state_data.funct_section[state_data.selected_funct],
-        )
-        for k in get_variable_names_in_funct_expression(funct_expression=function_copy)
-    }
+    # construct the definitions of the variables involved in the function
+    # (including the variables referenced by these variables)
+    variable_funct_strings = construct_variable_definitions(
+        variable_names=variable_names, funct_section_item=funct_section_item
+    )
 
     num_of_time_points = 1000  # number of discrete time points used for plotting
-    data = {
-        "t": np.linspace(0, state_data.funct_plot["max_time"], num_of_time_points),
-        "f(t)": return_function_from_funct_string(
-            funct_string=function_copy, variable_funct_strings=variable_funct_strings
-        )(
-            np.full((num_of_time_points,), state_data.funct_plot["x_val"]),
-            np.full((num_of_time_points,), state_data.funct_plot["y_val"]),
-            np.full((num_of_time_points,), state_data.funct_plot["z_val"]),
-            np.linspace(0, state_data.funct_plot["max_time"], num_of_time_points),
-        ),
-    }
+    time_points = np.linspace(0, funct_plot["max_time"], num_of_time_points)
+    function_values = return_function_from_funct_string(
+        funct_string=function_copy, variable_funct_strings=variable_funct_strings
+    )(
+        # scalar coordinates are broadcast over the time points
+        funct_plot["x_val"],
+        funct_plot["y_val"],
+        funct_plot["z_val"],
+        time_points,
+    )
+
+    import plotly.graph_objects as go
 
     # create figure object with the given data
-    fig = px.line(
-        data,
-        x="t",
-        y="f(t)",
-        title=f"{state_data.selected_funct}: {state_data.selected_funct_item}",
+    fig = go.Figure(
+        go.Scatter(
+            x=time_points,
+            y=function_values,
+            mode="lines",
+            hovertemplate="t=%{x}<br>f(t)=%{y}<extra></extra>",
+        ),
+        layout=dict(
+            title=f"{state_data.selected_funct}: {state_data.selected_funct_item}"
+        ),
     )
 
     # update layout of the figure
@@ -141,129 +160,292 @@ def return_function_from_funct_string(funct_string: str, variable_funct_strings:
 
     Args:
         funct_string (str): Funct definition
-        variable_funct_strings (dict): Funct definitions of the variables
-            involved in funct_string to be replaced in the expression
+        variable_funct_strings (dict): Funct definitions (or
+            LinearInterpolation / MultiFunction definitions) of the
+            variables involved in funct_string
+
+    Returns:
+        callable: callable function of x, y, z, t
+    """
+    # the variable definitions are passed on as (ordered) tuple to be
+    # hashable for the cache
+    return _build_kernel(funct_string, tuple(variable_funct_strings.items()))
+
+
+@functools.lru_cache(maxsize=128)
+def _build_kernel(funct_string: str, variable_items: tuple):
+    """Create function from funct string, cached for repeated plots of the
+    same expression.
+
+    Args:
+        funct_string (str): Funct definition
+        variable_items (tuple): (name, funct definition or
+            LinearInterpolation / MultiFunction definition) pairs of the
+            variables involved in funct_string
 
     Returns:
         callable: callable function of x, y, z, t
     """
+    # replace the power operator and heaviside functions with where /
+    # np.where
+    funct_string = funct_string.replace("^", "**")
+    funct_string = _HEAVISIDE_RE.sub(r"where(\1 >= 0, 1, 0)", funct_string)
+    funct_string = _HEAVISIDE_WITH_VALUE_RE.sub(
+        r"where(\1 > 0, 1, where(\1 == 0, \2, 0))", funct_string
+    )
 
-    def funct_using_eval(x, y, z, t):
+    import numexpr as ne
+
+    # compile the expression once (Numexpr evaluation: much safer than eval)
+    kernel = ne.NumExpr(funct_string)
+
+    # the variables are not substituted into the expression (which would
+    # paste their possibly long piecewise definitions for every
+    # occurrence), but compiled to own kernels: their values are evaluated
+    # once and passed on as inputs of the expression kernel (only the
+    # variables used by the expression, the variable items can also
+    # contain the variables of other expressions)
+    variable_kernels = {
+        variable_name: _build_variable_kernel(variable_definition, variable_items)
+        for variable_name, variable_definition in variable_items
+        if variable_name in kernel.input_names
+    }
+
+    def funct_using_numexpr(x, y, z, t):
         """Evaluate function expression for given positional x, y, z
-        coordinates and time t values.
+        coordinates and time t values (scalars or arrays).
 
         Args:
-            x (double): x-coordinate
-            y (double): y-coordinate
-            z (double): z-coordinate
-            t (double): time t
+            x (double | np.ndarray): x-coordinate
+            y (double | np.ndarray): y-coordinate
+            z (double | np.ndarray): z-coordinate
+            t (double | np.ndarray): time t
 
         Returns:
-            parsed object using ast.literal_eval
+            np.ndarray: function values (float64), broadcast to the shape
+            of the inputs
         """
-        # Create a safe environment
-        safe_dict = {
-            "x": x,
-            "y": y,
-            "z": z,
-            "t": t,
-            "sin": np.sin,
-            "cos": np.cos,
-            "exp": np.exp,
-            "log": np.log,
-            "sqrt": np.sqrt,
-            "where": np.where,
-            "pi": np.pi,
-            # "heaviside": np.heaviside, -> no heaviside, numexpr will
-            # not deal with this
-            # add other safe functions as needed
-        }
-
-        funct_string_copy = funct_string
-
-        # replace variables by their
-        for k, v in variable_funct_strings.items():
-            funct_string_copy = re.sub(
-                rf"(?<![A-Za-z]){k}(?![A-Za-z])", v, funct_string_copy
-            )
-
-        # replace heaviside functions with where / np.where
-        funct_string_copy = funct_string_copy.replace("^", "**")
-        funct_string_copy = re.sub(
-            r"heaviside\(([^),]+)\)", r"where(\1 >= 0, 1, 0)", funct_string_copy
-        )
-        funct_string_copy = re.sub(
-            r"heaviside\(([^),]+),\s*([^)]+)\)",
-            r"where(\1 > 0, 1, where(\1 == 0, \2, 0))",
-            funct_string_copy,
+        # evaluate the compiled expression, vectorized over all inputs
+        variables = {"x": x, "y": y, "z": z, "t": t, "pi": np.pi}
+        for variable_name, variable_kernel in variable_kernels.items():
+            variables[variable_name] = variable_kernel(x, y, z, t)
+        # integer / boolean expressions are cast to float64, so that
+        # downstream consumers always receive typed float arrays
+        values = np.asarray(
+            kernel(*(variables[name] for name in kernel.input_names)),
+            dtype=np.float64,
         )
+        # constant expressions evaluate to a 0-d array
+        return np.broadcast_to(values, np.broadcast(x, y, z, t).shape)
+
+    return funct_using_numexpr
+
 
-        # Numexpr evaluation (much safer)
-        return ne.evaluate(funct_string_copy, local_dict=safe_dict)
+def _build_variable_kernel(variable_definition, variable_items: tuple):
+    """Create function from the definition of a function variable.
 
-    return np.frompyfunc(funct_using_eval, 4, 1)
+    Args:
+        variable_definition (str | LinearInterpolation | MultiFunction): Funct
+            definition, LinearInterpolation or MultiFunction definition of
+            the variable
+        variable_items (tuple): (name, definition) pairs of the variables
+            which can be referenced by the variable definition
+
+    Returns:
+        callable: callable function of x, y, z, t
+    """
+    if isinstance(variable_definition, MultiFunction):
+        return _build_multifunction_kernel(variable_definition, variable_items)
+    if not isinstance(variable_definition, LinearInterpolation):
+        # unsupported variable types (empty definition, a warning was
+        # already issued) are evaluated as 0
+        return _build_kernel(variable_definition or "0.0", variable_items)
+
+    times = np.array(variable_definition.times, dtype=float)
+    values = np.array(variable_definition.values, dtype=float)
+
+    def funct_using_interp(x, y, z, t):
+        """Evaluate linear interpolation for given positional x, y, z
+        coordinates and time t values (scalars or arrays).
+
+        Args:
+            x (double | np.ndarray): x-coordinate
+            y (double | np.ndarray): y-coordinate
+            z (double | np.ndarray): z-coordinate
+            t (double | np.ndarray): time t
+
+        Returns:
+            np.ndarray: interpolated values (0 outside of the time range)
+        """
+        return np.interp(t, times, values, left=0.0, right=0.0)
 
+    return funct_using_interp
 
-def construct_funct_string_from_variable_data(
-    variable_name: str, funct_section_item: dict
+
+def _build_multifunction_kernel(
+    variable_definition: MultiFunction, variable_items: tuple
 ):
-    """Constructs a functional string from the given data for a function
-    variable."""
+    """Create function from the definition of a multifunction variable.
 
-    # retrieve variable data
-    variable_data = get_variable_data_by_name_in_funct_item(
-        variable_name=variable_name, funct_section_item=funct_section_item
-    )
+    Args:
+        variable_definition (MultiFunction): MultiFunction definition of the
+            variable
+        variable_items (tuple): (name, definition) pairs of the variables
+            which can be referenced by the time interval expressions
 
-    # construct functional expression string for supported types
-    funct_string = ""
-    match variable_data["TYPE"]:
-        case "linearinterpolation":
-            # get times and values
-            times, values = (
-                np.array(variable_data["TIMES"]),
-                np.array(variable_data["VALUES"]),
-            )
+    Returns:
+        callable: callable function of x, y, z, t
+    """
+    times = np.array(variable_definition.times, dtype=float)
+    # one compiled kernel per time interval
+    interval_kernels = [
+        _build_kernel(description, variable_items)
+        for description in variable_definition.descriptions[: len(times) - 1]
+    ]
 
-            # consistency check: time should start with 0.0
-            if float(times[0]) != 0.0:
-                raise Exception("Time should start with 0 in the TIMES section")
-            # loop through time instants and the functional expressions,
-            # using heaviside functions to differentiate between time intervals
-            funct_string = "("
-            for time_instant_index, time_instant in enumerate(times[:-1]):
-                if time_instant_index != 0:
-                    funct_string += "+"
-
-                funct_string += f"({values[time_instant_index]}+({values[time_instant_index + 1]}-{values[time_instant_index]})/({times[time_instant_index + 1]}-{time_instant})*(t-{time_instant}))*heaviside(t-{time_instant})*heaviside({times[time_instant_index + 1]}-t)"
-
-            funct_string += ")"
-
-        case "multifunction":
-            # get times and values
-            times, descriptions = (
-                np.array(variable_data["TIMES"]),
-                variable_data["DESCRIPTION"],
-            )
+    def funct_using_intervals(x, y, z, t):
+        """Evaluate multifunction for given positional x, y, z coordinates
+        and time t values (scalars or arrays).
 
-            # consistency check: time should start with 0.0
-            if float(times[0]) != 0.0:
-                raise Exception("Time should start with 0 in the TIMES section")
-            # loop through time instants and the functional expressions,
-            # using heaviside functions to differentiate between time intervals
-            funct_string = "("
-            for time_instant_index, time_instant in enumerate(times[:-1]):
-                if time_instant_index != 0:
-                    funct_string += "+"
+        Args:
+            x (double | np.ndarray): x-coordinate
+            y (double | np.ndarray): y-coordinate
+            z (double | np.ndarray): z-coordinate
+            t (double | np.ndarray): time t
 
-                funct_string += f"({descriptions[time_instant_index]}*heaviside(t-{time_instant})*heaviside({times[time_instant_index + 1]}-t))"
+        Returns:
+            np.ndarray: function values of the active time intervals (0
+            outside of the time range)
+        """
+        x, y, z, t = np.broadcast_arrays(x, y, z, t)
+
+        # index of the active time interval (the last time instant belongs
+        # to the last interval)
+        interval_indices = np.where(
+            t == times[-1],
+            len(interval_kernels) - 1,
+            np.searchsorted(times, t, side="right") - 1,
+        )
+
+        # evaluate each expression only at the time points of its interval
+        values = np.zeros(t.shape)
+        for interval_index, interval_kernel in enumerate(interval_kernels):
+            active = interval_indices == interval_index
+            if active.any():
+                values[active] = interval_kernel(
+                    x[active], y[active], z[active], t[active]
+                )
+        return values
+
+    return funct_using_intervals
+
+
+def construct_variable_definitions(variable_names: list, funct_section_item: dict):
+    """Constructs the definitions of the given function variables and of all
+    variables referenced (transitively) by their definitions.
 
-            funct_string += ")"
+    Args:
+        variable_names (list): names of the variables
+        funct_section_item (dict): function section item containing the
+            variables
+
+    Returns:
+        dict: definitions of the variables (see
+        construct_variable_definition), referenced variables before the
+        variables referencing them
+    """
+    variable_definitions = {}
+
+    def add_variable_definition(variable_name, referencing_variable_names):
+        """Adds the definition of a variable after the definitions of the
+        variables referenced by it.
 
-        case _:
-            # warning that this variable type is not yet supported for visualization
-            logger.warning(
-                f"Variable with {variable_data} not supported for visualization!"
+        Args:
+            variable_name (str): name of the variable
+            referencing_variable_names (tuple): names of the variables
+                (transitively) referencing the variable
+        """
+        if variable_name in variable_definitions:
+            return
+        if variable_name in referencing_variable_names:
+            raise Exception(
+                f"Cyclic definition of the variable {variable_name}: "
+                f"{' -> '.join(referencing_variable_names + (variable_name,))}"
+            )
+        variable_definition = construct_variable_definition(
+            variable_name=variable_name, funct_section_item=funct_section_item
+        )
+        for referenced_variable_name in _get_variable_names_in_definition(
+            variable_definition
+        ):
+            add_variable_definition(
+                referenced_variable_name,
+                referencing_variable_names + (variable_name,),
             )
+        variable_definitions[variable_name] = variable_definition
+
+    for variable_name in variable_names:
+        add_variable_definition(variable_name, ())
+    return variable_definitions
+
+
+def _get_variable_names_in_definition(variable_definition):
+    """Returns all variable names referenced by the definition of a function
+    variable.
+
+    Args:
+        variable_definition (str | LinearInterpolation | MultiFunction): Funct
+            definition, LinearInterpolation or MultiFunction definition of
+            the variable
+
+    Returns:
+        list: names of the referenced variables
+    """
+    if isinstance(variable_definition, LinearInterpolation):
+        return []
+    if isinstance(variable_definition, MultiFunction):
+        return get_variable_names_in_funct_expression(
+            " ".join(variable_definition.descriptions)
+        )
+    return get_variable_names_in_funct_expression(variable_definition)
 
-    return funct_string
+
+def construct_variable_definition(variable_name: str, funct_section_item: dict):
+    """Constructs the definition of a function variable used for the
+    evaluation: a LinearInterpolation for linearinterpolation variables, a
+    MultiFunction for multifunction variables, otherwise an empty string
+    (evaluated as 0).
+
+    Args:
+        variable_name (str): name of the variable
+        funct_section_item (dict): function section item containing the
+            variable
+
+    Returns:
+        str | LinearInterpolation | MultiFunction: definition of the variable
+    """
+    variable_data = get_variable_data_by_name_in_funct_item(
+        variable_name=variable_name, funct_section_item=funct_section_item
+    )
+    if variable_data["TYPE"] not in ["linearinterpolation", "multifunction"]:
+        # warning that this variable type is not yet supported for visualization
+        logger.warning(
+            f"Variable with {variable_data} not supported for visualization!"
+        )
+        return ""
+
+    # consistency check: time should start with 0.0
+    if float(variable_data["TIMES"][0]) != 0.0:
+        raise Exception("Time should start with 0 in the TIMES section")
+    times = tuple(float(time) for time in variable_data["TIMES"])
+    if variable_data["TYPE"] == "multifunction":
+        return MultiFunction(
+            times=times,
+            descriptions=tuple(
+                str(description) for description in variable_data["DESCRIPTION"]
+            ),
+        )
+    return LinearInterpolation(
+        times=times,
+        values=tuple(float(value) for value in variable_data["VALUES"]),
+    )
@@ -11,6 +11,45 @@ from loguru import logger
 
 from fourc_webviewer.python_utils import flatten_list
 
+# number of parsed fourc yaml files kept in memory
+FOURC_YAML_CACHE_SIZE = 8
+
+# parsed fourc yaml files (least recently used first): (resolved path,
+# modification time, size) -> content
+_fourc_yaml_cache = {}
+
+
+def load_fourc_yaml(fourc_yaml_file):
+    """Load a fourc yaml file for read-only use. The parsed content of the
+    last used files is cached and only parsed again once the file was
+    modified on disk. Files with INCLUDES are not cached, as changes of the
+    included files would go unnoticed.
+
+    Args:
+        fourc_yaml_file (str | Path): path to the fourc yaml file to be
+        loaded.
+
+    Returns:
+        FourCInput: content of the fourc yaml file (shared with other
+        callers: must not be modified).
+    """
+    path = Path(fourc_yaml_file).resolve()
+    file_stat = path.stat()
+    key = (path, file_stat.st_mtime_ns, file_stat.st_size)
+
+    fourc_yaml_content = _fourc_yaml_cache.pop(key, None)
+    if fourc_yaml_content is None:
+        fourc_yaml_content = FourCInput.from_4C_yaml(path)
+        if "INCLUDES" in fourc_yaml_content:
+            return fourc_yaml_content
+
+    # (re-)insert as most recently used and drop the least recently used
+    _fourc_yaml_cache[key] = fourc_yaml_content
+    while len(_fourc_yaml_cache) > FOURC_YAML_CACHE_SIZE:
+        _fourc_yaml_cache.pop(next(iter(_fourc_yaml_cache)))
+
+    return fourc_yaml_content
+
 
 def read_fourc_yaml_file(fourc_yaml_file):
     """Read in a given fourc yaml file. Validation is performed within the
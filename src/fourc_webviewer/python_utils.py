@@ -4,6 +4,24 @@ import re
 
 from fourcipp import CONFIG
 
+# candidates for float(): a superset of the strings accepted by float(), so
+# that no numeric string is rejected without calling float()
+_NUMBER_CANDIDATE_RE = re.compile(
+    r"\s*[-+]?(?:[\d_.]+(?:[eE][-+]?[\d_]+)?|inf(?:inity)?|nan)\s*",
+    re.IGNORECASE,
+)
+
+# precompiled regular expressions for parsing validation error messages:
+# "- Parameter in [...]" blocks up until the next one or end of string,
+# the "Error:" line of a block and the keys of the parameter path
+_VALIDATION_ERROR_BLOCK_RE = re.compile(
+    r"- Parameter in (?P<path>(?:\[[^\]]+\])+)\n"
+    r"(?P<body>.*?)(?=(?:- Parameter in )|\Z)",
+    re.DOTALL,
+)
+_VALIDATION_ERROR_MESSAGE_RE = re.compile(r"Error:\s*(.+)")
+_VALIDATION_ERROR_PATH_KEY_RE = re.compile(r'\["([^"]+)"\]')
+
 
 def flatten_list(input_list):
     """Flattens a given (multi-level) list into a single list.
@@ -17,11 +35,17 @@ def flatten_list(input_list):
 
     output_list = []
 
-    for input_list_item in input_list:
-        if isinstance(input_list_item, list):
-            output_list.extend(flatten_list(input_list_item))
-        else:
+    # explicit stack of the list iterators (instead of recursion): a nested
+    # list suspends the iteration of its parent list until it is exhausted
+    iterator_stack = [iter(input_list)]
+    while iterator_stack:
+        for input_list_item in iterator_stack[-1]:
+            if isinstance(input_list_item, list):
+                iterator_stack.append(iter(input_list_item))
+                break
             output_list.append(input_list_item)
+        else:
+            iterator_stack.pop()
 
     return output_list
 
@@ -37,43 +61,83 @@ def find_value_recursively(input_dict, target_key):
     Returns:
         any | None: value of the specific target key
     """
-    if isinstance(input_dict, dict):
-        for key, value in input_dict.items():
-            if key == target_key:
-                return value
-            result = find_value_recursively(value, target_key)
-            if result is not None:
-                return result
-    elif isinstance(input_dict, list):
-        for item in input_dict:
-            result = find_value_recursively(item, target_key)
-            if result is not None:
-                return result
+    # depth-first search with an explicit stack of the (key, value)
+    # iterators of the nested dicts / lists (instead of recursion)
+    iterator_stack = [_iterate_key_value_pairs(input_dict)]
+    while iterator_stack:
+        for key, value in iterator_stack[-1]:
+            if key is not _LIST_ITEM and key == target_key:
+                if value is not None:
+                    return value
+                # None value: the search within this dict is aborted
+                iterator_stack.pop()
+                break
+            if isinstance(value, (dict, list)):
+                iterator_stack.append(_iterate_key_value_pairs(value))
+                break
+        else:
+            iterator_stack.pop()
     return None
 
 
-def get_by_path(dct, path):
-    """Retrieve the value at the nested path from dct.
+# placeholder key of list items within _iterate_key_value_pairs
+_LIST_ITEM = object()
+
+
+def _iterate_key_value_pairs(input_element):
+    """Iterates over the (key, value) pairs of a dict or over the
+    (_LIST_ITEM, item) pairs of a list.
 
-    Raises KeyError if any key is missing.
+    Args:
+        input_element (dict | list | any): element to be iterated over
+
+    Returns:
+        iterator: iterator over the (key, value) pairs (empty for other
+        types)
     """
-    current = dct
-    for key in path:
-        current = current[key]
-    return current
+    if isinstance(input_element, dict):
+        return iter(input_element.items())
+    if isinstance(input_element, list):
+        return ((_LIST_ITEM, item) for item in input_element)
+    return iter(())
 
 
-def dict_leaves_to_number_if_schema(value, schema_path=[]):
-    """Convert all leaves of a dict to numbers if possible."""
+def dict_leaves_to_number_if_schema(value):
+    """Convert all leaves of a dict to numbers if possible, i.e., string
+    leaves of number or integer type according to the 4C schema. Keys which
+    are not described by the schema are left unchanged (and reported by the
+    subsequent validation).
+
+    Args:
+        value (dict): dict to be converted (in place).
+    Returns:
+        dict: converted dict.
+    """
+    return _dict_leaves_to_number_if_schema(value, CONFIG.fourc_json_schema)
+
+
+def _dict_leaves_to_number_if_schema(value, schema_node):
+    """Convert all leaves of a dict to numbers if possible, passing the
+    already resolved schema node down instead of walking the schema from
+    its root for every leaf.
+
+    Args:
+        value (any): dict (or leaf) to be converted.
+        schema_node (dict | None): schema node corresponding to value (None
+            if value is not described by the schema).
+    Returns:
+        any: converted value.
+    """
     if isinstance(value, dict):
+        child_schema_nodes = (schema_node or {}).get("properties", {})
         for k, v in value.items():
-            value[k] = dict_leaves_to_number_if_schema(
-                v, schema_path + ["properties", k]
-            )
+            value[k] = _dict_leaves_to_number_if_schema(v, child_schema_nodes.get(k))
         return value
-    if isinstance(value, str) and get_by_path(
-        CONFIG.fourc_json_schema, schema_path + ["type"]
-    ) in ["number", "integer"]:
+    if (
+        isinstance(value, str)
+        and schema_node
+        and schema_node.get("type") in ["number", "integer"]
+    ):
         return smart_string2number_cast(value)
     return value
 
@@ -91,33 +155,33 @@ def dict_number_leaves_to_string(value):
     return value
 
 
-def parse_validation_error_text(text):
+def parse_validation_error_text(text, max_error_length=None):
     """Parse a ValidationError message string (with multiple "- Parameter in
     [...]" blocks) into a nested dict.
 
     Args:
         text (str): <fill in your definition>
+        max_error_length (int | None): maximum length of the error
+            messages. Longer messages are truncated and end with " ...".
+            No truncation if None.
     Returns:
         dict: <fill in your definition>
     """
     error_dict = {}
     # Match "- Parameter in [...]" blocks up until the next one or end of string
-    block_re = re.compile(
-        r"- Parameter in (?P<path>(?:\[[^\]]+\])+)\n"
-        r"(?P<body>.*?)(?=(?:- Parameter in )|\Z)",
-        re.DOTALL,
-    )
-    for m in block_re.finditer(text):
+    for m in _VALIDATION_ERROR_BLOCK_RE.finditer(text):
         path_str = m.group("path")
         body = m.group("body")
 
         # extract the Error: line
-        err_m = re.search(r"Error:\s*(.+)", body)
+        err_m = _VALIDATION_ERROR_MESSAGE_RE.search(body)
         if not err_m:
             continue
         err_msg = err_m.group(1).strip()
+        if max_error_length is not None and len(err_msg) > max_error_length:
+            err_msg = err_msg[: max_error_length - 3] + " ..."
 
-        keys = re.findall(r'\["([^"]+)"\]', path_str)
+        keys = _VALIDATION_ERROR_PATH_KEY_RE.findall(path_str)
 
         # walk/create nested dicts, then assign the message at the leaf
         cur = error_dict
@@ -141,6 +205,9 @@ def smart_string2number_cast(input_string):
     # otherwise boolean values are converted to 0/1
     if not isinstance(input_string, str):
         return input_string
+    # fast path for non-numeric strings (avoids raising ValueError)
+    if not _NUMBER_CANDIDATE_RE.fullmatch(input_string):
+        return input_string
     try:
         # first convert to float
         input_float = float(input_string)
@@ -3,12 +3,14 @@
 https://github.com/nschloe/meshio/blob/main/src/meshio/exodus/_exodus.py
 """
 
+import functools
+import hashlib
 import re
 from pathlib import Path
 
 import numpy as np
 from fourcipp.fourc_input import FourCInput
-from lnmmeshio import read, read_mesh, write
+from lnmmeshio import read, read_mesh, to_mesh, write_mesh
 from lnmmeshio.discretization import (
     LineNodeset,
     PointNodeset,
@@ -22,11 +24,17 @@ from meshio._common import warn
 from meshio._exceptions import ReadError
 from meshio._mesh import Mesh
 
+from fourc_webviewer.input_file_utils.io_utils import load_fourc_yaml
+
 # enabled suffixes for geometry files
 EXODUS_FILE_SUFFIXES = [".exo", ".e"]
 VTU_FILE_SUFFIXES = [".vtu"]
 SUPPORTED_GEOMETRY_FORMATS = EXODUS_FILE_SUFFIXES + VTU_FILE_SUFFIXES
 
+# store the element fibers of the converted vtu files in single precision
+# (sufficient for visualization); set to False to keep double precision
+QUANTIZE_FIBERS = True
+
 
 def read_geom_mesh(mesh_file: Path) -> Mesh:
     """Reads and performs postprocessing of the read-in mesh for external
@@ -100,6 +108,19 @@ exodus_to_meshio_type = {
 }
 meshio_to_exodus_type = {v: k for k, v in exodus_to_meshio_type.items()}
 
+# converted vtu files: vtu file path -> (digest of the source files,
+# modification time of the vtu file)
+_converted_vtu_files = {}
+
+# nodeset class and node attribute for the geometric reference in the design
+# condition names (checked in this order)
+design_condition_nodesets = {
+    " POINT ": (PointNodeset, "pointnodesets"),
+    " LINE ": (LineNodeset, "linenodesets"),
+    " SURF ": (SurfaceNodeset, "surfacenodesets"),
+    " VOL ": (VolumeNodeset, "volumenodesets"),
+}
+
 # special treatment when the node orders between meshio and lnmmeshio do not match
 special_meshio_mesh_to_lnmmeshio_dis_to_vtu_node_order = {
     "hexahedron27": [
@@ -133,6 +154,15 @@ special_meshio_mesh_to_lnmmeshio_dis_to_vtu_node_order = {
     ]
 }  # to be verified in more detail!
 
+# composed node permutations (the dis mapping followed by the vtu mapping)
+# applied to the elements by switch_node_order
+special_meshio_mesh_to_lnmmeshio_node_permutation = {
+    cell_type: np.array([dis_id for dis_id, _ in node_orders], dtype=np.intp)[
+        np.array([vtu_id for _, vtu_id in node_orders], dtype=np.intp)
+    ]
+    for cell_type, node_orders in special_meshio_mesh_to_lnmmeshio_dis_to_vtu_node_order.items()
+}
+
 
 def switch_node_order(mesh_exo: Mesh) -> Mesh:
     """Switch node orders for read-in Exodus mesh such that the node orders are
@@ -144,34 +174,22 @@ def switch_node_order(mesh_exo: Mesh) -> Mesh:
         Mesh: modified read-in Exodus mesh, with adapted order
     """
 
+    # only copy the mesh if any node order has to be switched
+    if not any(
+        cell_block.type in special_meshio_mesh_to_lnmmeshio_node_permutation
+        for cell_block in mesh_exo.cells
+    ):
+        return mesh_exo
     copy_mesh_exo = mesh_exo.copy()
 
-    # run through elements
+    # run through element blocks
     for cell_block in copy_mesh_exo.cells:
-        cell_type = cell_block.type
-
-        if cell_type in special_meshio_mesh_to_lnmmeshio_dis_to_vtu_node_order:
-            # define nodal mappings
-            dis_mapping = [
-                dis_id
-                for meshio_id, (dis_id, vtu_id) in enumerate(
-                    special_meshio_mesh_to_lnmmeshio_dis_to_vtu_node_order[cell_type]
-                )
-            ]
-            vtu_mapping = [
-                vtu_id
-                for meshio_id, (dis_id, vtu_id) in enumerate(
-                    special_meshio_mesh_to_lnmmeshio_dis_to_vtu_node_order[cell_type]
-                )
+        if cell_block.type in special_meshio_mesh_to_lnmmeshio_node_permutation:
+            # apply the node permutation to all elements of the block at once
+            cell_block.data[:] = cell_block.data[
+                :, special_meshio_mesh_to_lnmmeshio_node_permutation[cell_block.type]
             ]
 
-            # apply mappings to the nodes of all elements
-            for el_id in range(len(cell_block.data)):
-                element_nodes = cell_block.data[el_id]
-                dis_element_nodes = element_nodes[dis_mapping]
-                vtu_element_nodes = dis_element_nodes[vtu_mapping]
-                cell_block.data[el_id] = vtu_element_nodes
-
     return copy_mesh_exo
 
 
@@ -208,19 +226,26 @@ def postprocess_vtu_mesh(mesh: Mesh) -> Mesh:
     # move "point data" to the dedicated point sets
     for old_key in keys_to_rename:
         new_key = old_key.replace("point_set_", "")
-        copy_mesh.point_sets[new_key] = np.where(mesh.point_data[old_key] == 1)[0]
+        copy_mesh.point_sets[new_key] = np.flatnonzero(mesh.point_data[old_key] == 1)
         copy_mesh.point_data.pop(old_key)
 
     # separate cell_data['block_id'] into specific cell sets to have the same structure as for exo files
     if "block_id" in copy_mesh.cell_data:
         cell_data_block_id = copy_mesh.cell_data["block_id"][0]
 
-        # get all unique block ids
-        unique_block_ids = np.unique(cell_data_block_id)
+        # get all unique block ids and their element counts
+        unique_block_ids, block_counts = np.unique(
+            cell_data_block_id, return_counts=True
+        )
 
-        # loop through unique block ids and create their respective cell sets
-        for bid in unique_block_ids:
-            copy_mesh.cell_sets[str(int(bid))] = np.where(cell_data_block_id == bid)[0]
+        # group the element ids by block id in a single (stable) sort, then
+        # split them into the respective cell sets
+        element_ids_by_block = np.split(
+            np.argsort(cell_data_block_id, kind="stable"),
+            np.cumsum(block_counts)[:-1],
+        )
+        for bid, block_element_ids in zip(unique_block_ids, element_ids_by_block):
+            copy_mesh.cell_sets[str(int(bid))] = block_element_ids
 
     return copy_mesh
 
@@ -240,6 +265,10 @@ def _categorize(names):
     double = []
     triple = []
     is_accounted_for = [False] * len(names)
+    # index lookup of the names (first occurrence, as list.index)
+    name_indices = {}
+    for index, name in enumerate(names):
+        name_indices.setdefault(name, index)
     k = 0
     while True:
         if k == len(names):
@@ -250,15 +279,10 @@ def _categorize(names):
         name = names[k]
         if name[-1] == "X":
             i_x = k
-            try:
-                i_y = names.index(name[:-1] + "Y")
-            except ValueError:
-                i_y = None
-            try:
-                i_z = names.index(name[:-1] + "Z")
-            except ValueError:
-                i_z = None
-            if i_y and i_z:
+            i_y = name_indices.get(name[:-1] + "Y")
+            # the Z component is only relevant for an existing Y component
+            i_z = name_indices.get(name[:-1] + "Z") if i_y is not None else None
+            if i_y is not None and i_z is not None:
                 triple.append((name[:-1], i_x, i_y, i_z))
                 is_accounted_for[i_x] = True
                 is_accounted_for[i_y] = True
@@ -268,11 +292,8 @@ def _categorize(names):
                 is_accounted_for[i_x] = True
         elif name[-2:] == "_R":
             i_r = k
-            try:
-                i_z = names.index(name[:-2] + "_Z")
-            except ValueError:
-                i_z = None
-            if i_z:
+            i_z = name_indices.get(name[:-2] + "_Z")
+            if i_z is not None:
                 double.append((name[:-2], i_r, i_z))
                 is_accounted_for[i_r] = True
                 is_accounted_for[i_z] = True
@@ -290,6 +311,27 @@ def _categorize(names):
     return single, double, triple
 
 
+# variable index and element block of the exodus element variable values
+_VALS_ELEM_VAR_RE = re.compile(r"vals_elem_var(\d+)?(?:eb(\d+))?")
+
+
+def _decode_char_rows(char_array):
+    """Decode the rows of a (null-padded) exodus character array to strings
+    at once, instead of joining and decoding each row separately.
+
+    Args:
+        char_array (np.ndarray): character array (dtype S1), the last axis
+            containing the characters of each string.
+    Returns:
+        list: decoded strings of all rows (flattened in row-major order).
+    """
+    char_array = np.ascontiguousarray(char_array, dtype="S1")
+    # view each row as one fixed-length byte string (trailing null
+    # characters are stripped)
+    rows = char_array.view(f"S{char_array.shape[-1]}").reshape(-1)
+    return np.char.decode(rows, "UTF-8").tolist()
+
+
 def read_exodus(filename, use_set_names=False):  # noqa: C901
     """Reads a given exodus file.
 
@@ -311,7 +353,13 @@ def read_exodus(filename, use_set_names=False):  # noqa: C901
         # assert b''.join(nc.variables['coor_names'][1]) == b'Y'
         # assert b''.join(nc.variables['coor_names'][2]) == b'Z'
 
-        points = np.zeros((len(nc.dimensions["num_nodes"]), 3))
+        # the coordinates are filled in below (no zero-initialization); a
+        # combined coord variable replaces the array entirely
+        points = (
+            None
+            if "coord" in nc.variables
+            else np.empty((len(nc.dimensions["num_nodes"]), 3))
+        )
         point_data_names = []
         cell_data_names = []
         pd = {}
@@ -329,24 +377,26 @@ def read_exodus(filename, use_set_names=False):  # noqa: C901
 
         element_running_index = 0
 
+        # read raw arrays for all variables (no masked array conversion)
+        nc.set_auto_maskandscale(False)
+
         for key, value in nc.variables.items():
             if key == "info_records":
-                value.set_auto_mask(False)
-                for c in value[:]:
-                    info += [b"".join(c).decode("UTF-8")]
+                info += _decode_char_rows(value[:])
             elif key == "qa_records":
-                value.set_auto_mask(False)
-                for val in value:
-                    info += [b"".join(c).decode("UTF-8") for c in val[:]]
+                info += _decode_char_rows(value[:])
             elif key[:7] == "connect":
                 meshio_type = exodus_to_meshio_type[value.elem_type.upper()]
+                # read the connectivity only once
+                connectivity = value[:]
                 cell_sets[str(len(cell_sets) + 1)] = np.arange(
-                    element_running_index, element_running_index + len(value[:])
+                    element_running_index, element_running_index + len(connectivity)
                 )
-                cells.append((meshio_type, value[:] - 1))
-                element_running_index += len(value[:])
+                cells.append((meshio_type, connectivity - 1))
+                element_running_index += len(connectivity)
             elif key == "coord":
-                points = nc.variables["coord"][:].T
+                # contiguous copy instead of a transposed view
+                points = np.ascontiguousarray(value[:].T)
             elif key == "coordx":
                 points[:, 0] = value[:]
             elif key == "coordy":
@@ -354,25 +404,21 @@ def read_exodus(filename, use_set_names=False):  # noqa: C901
             elif key == "coordz":
                 points[:, 2] = value[:]
             elif key == "name_nod_var":
-                value.set_auto_mask(False)
-                point_data_names = [b"".join(c).decode("UTF-8") for c in value[:]]
+                point_data_names = _decode_char_rows(value[:])
             elif key[:12] == "vals_nod_var":
                 idx = 0 if len(key) == 12 else int(key[12:]) - 1
-                value.set_auto_mask(False)
                 # For now only take the first value
                 pd[idx] = value[0]
                 if len(value) > 1:
                     warn("Skipping some time data")
             elif key == "name_elem_var":
-                value.set_auto_mask(False)
-                cell_data_names = [b"".join(c).decode("UTF-8") for c in value[:]]
+                cell_data_names = _decode_char_rows(value[:])
             elif key[:13] == "vals_elem_var":
                 # eb: element block
-                m = re.match("vals_elem_var(\\d+)?(?:eb(\\d+))?", key)
+                m = _VALS_ELEM_VAR_RE.match(key)
                 idx = 0 if m.group(1) is None else int(m.group(1)) - 1
                 block = 0 if m.group(2) is None else int(m.group(2)) - 1
 
-                value.set_auto_mask(False)
                 # For now only take the first value
                 if idx not in cd:
                     cd[idx] = {}
@@ -381,23 +427,35 @@ def read_exodus(filename, use_set_names=False):  # noqa: C901
                 if len(value) > 1:
                     warn("Skipping some time data")
             elif key == "ns_prop1":
-                value.set_auto_mask(False)
                 ns_ids = value[:]
             elif key == "ns_names":
-                value.set_auto_mask(False)
-                ns_names = [b"".join(c).decode("UTF-8") for c in value[:]]
+                ns_names = _decode_char_rows(value[:])
             elif key == "eb_prop1":
-                value.set_auto_mask(False)
                 eb_ids = value[:]
             elif key == "eb_names":
-                value.set_auto_mask(False)
-                eb_names = [b"".join(c).decode("UTF-8") for c in value[:]]
+                eb_names = _decode_char_rows(value[:])
             elif key.startswith("node_ns"):  # Expected keys: node_ns1, node_ns2
                 ns.append(value[:] - 1)  # Exodus is 1-based
 
+        # zero the coordinates not contained in the file (e.g. coordz of
+        # 2D meshes)
+        if "coord" not in nc.variables:
+            for i, coord_key in enumerate(["coordx", "coordy", "coordz"]):
+                if coord_key not in nc.variables:
+                    points[:, i] = 0.0
+
         # merge element block data; can't handle blocks yet
         for k, value in cd.items():
-            cd[k] = np.concatenate(list(value.values()))
+            block_values = list(value.values())
+            merged = np.empty(
+                (sum(len(v) for v in block_values), *block_values[0].shape[1:]),
+                dtype=np.result_type(*block_values),
+            )
+            offset = 0
+            for v in block_values:
+                merged[offset : offset + len(v)] = v
+                offset += len(v)
+            cd[k] = merged
 
         # Check if there are any <name>R, <name>Z tuples or <name>X, <name>Y, <name>Z
         # triplets in the point data. If yes, they belong together.
@@ -411,18 +469,20 @@ def read_exodus(filename, use_set_names=False):  # noqa: C901
         for name, idx0, idx1, idx2 in triple:
             point_data[name] = np.column_stack([pd[idx0], pd[idx1], pd[idx2]])
 
+        # slice the merged element data into the cell blocks at the block
+        # offsets (the variables are aligned by their index, independent of
+        # their order in the file)
+        block_offsets = np.cumsum([0] + [len(cell) for _, cell in cells])
         cell_data = {}
-        k = 0
-        for _, cell in cells:
-            n = len(cell)
-            for name, data in zip(cell_data_names, cd.values()):
-                if name not in cell_data:
-                    cell_data[name] = []
-                cell_data[name].append(data[k : k + n])
-            k += n
+        for idx, name in enumerate(cell_data_names):
+            if cells and idx in cd:
+                cell_data[name] = [
+                    cd[idx][start:end]
+                    for start, end in zip(block_offsets[:-1], block_offsets[1:])
+                ]
 
     # write point and cell sets with correct ids
-    point_sets = {str(id): dat.tolist() for id, dat in zip(ns_ids, ns)}
+    point_sets = {str(id): dat for id, dat in zip(ns_ids, ns)}
     cell_sets = {
         str(name): cell_set for name, cell_set in zip(eb_ids, cell_sets.values())
     }
@@ -456,15 +516,14 @@ def get_geometry_file(fourc_yaml: FourCInput) -> list:
         list: list of file names (including extension) of files referenced in the fourc yaml file. If none where found, the list is empty.
     """
 
-    keys_ending_with_geometry = [
-        k for k in fourc_yaml.sections if k.endswith("GEOMETRY")
-    ]
-    # loop through keys and get the corresponding files
+    # loop through the geometry sections and get the corresponding files
     geometry_files = []
-    for k in keys_ending_with_geometry:
-        if "FILE" not in fourc_yaml[k]:
+    for k, section in fourc_yaml.sections.items():
+        if not k.endswith("GEOMETRY"):
+            continue
+        if "FILE" not in section:
             raise Exception("Specified geometry section, but without a FILE!")
-        geometry_files.append(fourc_yaml[k]["FILE"])
+        geometry_files.append(section["FILE"])
 
     if not geometry_files:
         return []
@@ -492,9 +551,21 @@ class FourCGeometry:
             first_render (bool): is this the initial webviewer rendering, i.e., the rendering of the default files?
         """
 
+        # print representation (built on first use)
+        self._str_representation = None
+
+        # discretization and mesh: not read if an up-to-date vtu file is
+        # reused (only the vtu file path is set then)
+        self._dis = None
+        self._mesh = None
+
         # read-in and save yaml file content
         self._fourc_yaml_file = fourc_yaml_file
-        self._fourc_yaml = FourCInput.from_4C_yaml(input_file_path=fourc_yaml_file)
+        self._fourc_yaml = load_fourc_yaml(fourc_yaml_file)
+
+        # referenced geometry files (used for the geometry type and the mesh
+        # file)
+        self._geometry_files = get_geometry_file(fourc_yaml=self._fourc_yaml)
 
         # set path for the vtu file to be created based on the geometry type
         self._vtu_file_path = str(Path(temp_dir) / f"{Path(fourc_yaml_file).stem}.vtu")
@@ -503,8 +574,16 @@ class FourCGeometry:
         if self.geom_type == "legacy":
             # convert yaml file to vtu file and return the path to the vtu file
             try:
+                # skip the conversion if the vtu file was converted from the
+                # same sources
+                source_digest = self.get_source_files_digest()
+                if self.is_vtu_up_to_date(source_digest):
+                    logger.info(f"Reusing up-to-date file {self._vtu_file_path}")
+                    return
+
                 self._dis = read(str(fourc_yaml_file))
                 self.convert_dis_to_vtu()
+                self.register_converted_vtu(source_digest)
             except Exception as exc:  # if file conversion not successful
                 # log unsuccessful conversion
                 logger.error(exc)
@@ -513,9 +592,7 @@ class FourCGeometry:
         elif self.geom_type == "external_geometry":
             try:
                 # read mesh: for the first rendering, we take the relative path with respect to the yaml file; for subsequent renderings, we will account for the absolute path
-                self._mesh_file = Path(
-                    get_geometry_file(fourc_yaml=self._fourc_yaml)[0]
-                )
+                self._mesh_file = Path(self._geometry_files[0])
                 if first_render:
                     self._mesh_file = Path(fourc_yaml_file).parent / self._mesh_file
                 else:
@@ -525,9 +602,20 @@ class FourCGeometry:
                         f"The mesh file {self._mesh_file} does not exist for the fourc yaml file {fourc_yaml_file}"
                     )
 
+                # skip the conversion if the vtu file was converted from the
+                # same sources
+                source_digest = self.get_source_files_digest(self._mesh_file)
+                if self.is_vtu_up_to_date(source_digest):
+                    logger.info(f"Reusing up-to-date file {self._vtu_file_path}")
+                    return
+
                 # read and postprocess mesh
                 self._mesh = read_geom_mesh(self._mesh_file)
 
+                # cumulative element counts of the cell blocks (used to locate
+                # the elements of the cell sets)
+                self._cum_el_counts = np.cumsum([len(cs) for cs in self._mesh.cells])
+
                 # convert mesh to discretization preliminarily, without further info from the yaml file -> this is then added below
                 self._dis = mesh2Discretization(mesh=self._mesh)
 
@@ -536,6 +624,7 @@ class FourCGeometry:
 
                 # convert to vtu
                 self.convert_dis_to_vtu()
+                self.register_converted_vtu(source_digest)
 
                 # log successful conversion
                 logger.success(
@@ -548,13 +637,65 @@ class FourCGeometry:
                 logger.critical("Conversion to vtu was not successful")
                 self._vtu_file_path = ""
 
-    @property
+    def get_source_files_digest(self, *geometry_files) -> str:
+        """Get the digest of the content of all files the vtu file is
+        converted from: the yaml input, its included files and the given
+        geometry files.
+
+        Args:
+            *geometry_files (str | Path): referenced geometry files.
+        Returns:
+            str: hex digest of the file contents.
+        """
+        yaml_dir = Path(self._fourc_yaml_file).parent
+        included_files = (
+            [yaml_dir / f for f in self._fourc_yaml["INCLUDES"]]
+            if "INCLUDES" in self._fourc_yaml
+            else []
+        )
+
+        digest = hashlib.sha256()
+        for source_file in [self._fourc_yaml_file, *included_files, *geometry_files]:
+            with open(source_file, "rb") as f:
+                digest.update(hashlib.file_digest(f, "sha256").digest())
+        return digest.hexdigest()
+
+    def is_vtu_up_to_date(self, source_digest: str) -> bool:
+        """Check whether the vtu file was converted from sources with the
+        given content and was not modified since.
+
+        Args:
+            source_digest (str): digest of the source files (see
+                get_source_files_digest).
+        Returns:
+            bool: True if the vtu file does not need to be converted again.
+        """
+        vtu_file = Path(self._vtu_file_path)
+        return vtu_file.exists() and _converted_vtu_files.get(self._vtu_file_path) == (
+            source_digest,
+            vtu_file.stat().st_mtime_ns,
+        )
+
+    def register_converted_vtu(self, source_digest: str):
+        """Register the vtu file as converted from sources with the given
+        content.
+
+        Args:
+            source_digest (str): digest of the source files (see
+                get_source_files_digest).
+        """
+        _converted_vtu_files[self._vtu_file_path] = (
+            source_digest,
+            Path(self._vtu_file_path).stat().st_mtime_ns,
+        )
+
+    @functools.cached_property
     def geom_type(self) -> str:
-        """Get geometry type for the given yaml input."""
+        """Get geometry type for the given yaml input (determined once)."""
         # check for eventual geometry files
-        if get_geometry_file(fourc_yaml=self._fourc_yaml):
+        if self._geometry_files:
             # get geometry file suffix and return the associated geometry type
-            geom_file = get_geometry_file(fourc_yaml=self._fourc_yaml)[0]
+            geom_file = self._geometry_files[0]
             geom_file_suffix = Path(geom_file).resolve().suffix
             if geom_file_suffix in SUPPORTED_GEOMETRY_FORMATS:
                 return "external_geometry"
@@ -562,7 +703,7 @@ class FourCGeometry:
                 raise Exception(
                     f"The given geometry file {geom_file} is currently not supported!"
                 )
-        elif [k for k in self._fourc_yaml.sections if k.endswith("ELEMENTS")]:
+        elif any(k.endswith("ELEMENTS") for k in self._fourc_yaml.sections):
             return "legacy"
         else:
             raise Exception(
@@ -578,6 +719,7 @@ class FourCGeometry:
     def vtu_file_path(self, value):
         """Set the path to the converted vtu file."""
         self._vtu_file_path = value
+        self._str_representation = None
 
     def get_element_ids_of_block(self, element_block_id):
         """Get element ids of a given block (element block id is 1-based)."""
@@ -593,29 +735,25 @@ class FourCGeometry:
             ndarray: array of node indices within the specified element block.
         """
 
-        # get cumulative element counts for each block
-        cum_el_counts = np.cumsum([len(cs) for cs in self._mesh.cells])
-
         # get all element ids in the considered cell set
-        all_el_ids = self._mesh.cell_sets[str(element_block_id)]
-
-        # declare array containing all node ids
-        all_node_ids = []
-
-        for el_id in all_el_ids:
-            # get block index
-            block_index = np.searchsorted(cum_el_counts, el_id, side="right")
+        all_el_ids = np.asarray(self._mesh.cell_sets[str(element_block_id)], dtype=int)
 
-            # get relative element id within the block
-            if block_index == 0:
-                rel_el_id = el_id
-            else:
-                rel_el_id = el_id - cum_el_counts[block_index - 1]
+        # get block indices and relative element ids within the blocks of
+        # all elements at once
+        block_indices = np.searchsorted(self._cum_el_counts, all_el_ids, side="right")
+        rel_el_ids = (
+            all_el_ids - np.concatenate(([0], self._cum_el_counts))[block_indices]
+        )
 
-            # retrieve corresponding node ids
-            all_node_ids.append(self._mesh.cells[block_index].data[rel_el_id - 1])
+        # retrieve corresponding node ids (gathered per block)
+        all_node_ids = [
+            self._mesh.cells[block_index]
+            .data[rel_el_ids[block_indices == block_index]]
+            .ravel()
+            for block_index in np.unique(block_indices)
+        ]
 
-        return np.unique(all_node_ids)
+        return np.unique(np.concatenate([np.empty(0, dtype=int), *all_node_ids]))
 
     def enhance_dis_with_fourc_yaml_info(self):
         """Enhance contained Discretization with further information from the
@@ -623,31 +761,30 @@ class FourCGeometry:
         # --> read in nodeset info (pointnodesets, linenodesets, surfacenodesets, volumenodesets) based on the design sections specified in the yaml file
         # get all design sections
         all_design_sections = [
-            {sec: val} for sec, val in self._fourc_yaml.items() if "DESIGN " in sec
+            (sec, val) for sec, val in self._fourc_yaml.items() if "DESIGN " in sec
         ]
 
-        # loop through design sections, add point, surf, line, vol nodesets
-        for dsect in all_design_sections:
-            # get condition name
-            dsect_name = next(iter(dsect))
-
-            # check geometry type of condition
-            geometry_type = ""
-            if " POINT " in dsect_name:
-                geometry_type = "point"
-            elif " LINE " in dsect_name:
-                geometry_type = "line"
-            elif " SURF " in dsect_name:
-                geometry_type = "surf"
-            elif " VOL " in dsect_name:
-                geometry_type = "vol"
-            else:
+        # loop through design sections (condition name, entities), add point,
+        # surf, line, vol nodesets
+        for dsect_name, dsect_entities in all_design_sections:
+            # get nodeset class and node attribute for the geometry type of
+            # the condition
+            nodeset_type = next(
+                (
+                    nodeset_type
+                    for geometry_type, nodeset_type in design_condition_nodesets.items()
+                    if geometry_type in dsect_name
+                ),
+                None,
+            )
+            if nodeset_type is None:
                 raise Exception(
                     "Cannot yet handle conditions without geometric references (POINT, LINE, SURF, VOL) in their condition names!"
                 )
+            nodeset_class, nodeset_attr = nodeset_type
 
             # add the corresponding nodesets for each geometry type
-            for entity in dsect[dsect_name]:
+            for entity in dsect_entities:
                 # get entity number
                 entity_number = entity["E"]
 
@@ -666,7 +803,9 @@ class FourCGeometry:
                 # get referenced nodes in the considered entity
                 all_cond_nodes = []
                 if entity_type == "node_set_id":
-                    all_cond_nodes = np.array(self._mesh.point_sets[f"{entity_number}"])
+                    all_cond_nodes = np.asarray(
+                        self._mesh.point_sets[f"{entity_number}"]
+                    )
                 elif entity_type == "element_block_id":
                     all_cond_nodes = self.get_all_nodes_in_element_block(
                         element_block_id=entity_number
@@ -676,34 +815,12 @@ class FourCGeometry:
                         f"Unsupported entity type: {entity_type} for entity {entity} of condition {dsect_name}!"
                     )
 
-                # add point sets
-                if geometry_type == "point":
-                    for cond_node_id, cond_node in enumerate(all_cond_nodes):
-                        self._dis.nodes[cond_node].pointnodesets.append(
-                            PointNodeset(id=str(entity_number))
-                            # PointNodeset(id=len(dis_exo.nodes[cond_node].pointnodesets))
-                        )
-                elif geometry_type == "line":
-                    for cond_node_id, cond_node in enumerate(all_cond_nodes):
-                        self._dis.nodes[cond_node].linenodesets.append(
-                            LineNodeset(id=str(entity_number))
-                        )
-
-                elif geometry_type == "surf":
-                    for cond_node_id, cond_node in enumerate(all_cond_nodes):
-                        self._dis.nodes[cond_node].surfacenodesets.append(
-                            SurfaceNodeset(id=str(entity_number))
-                        )
-
-                elif geometry_type == "vol":
-                    for cond_node_id, cond_node in enumerate(all_cond_nodes):
-                        self._dis.nodes[cond_node].volumenodesets.append(
-                            VolumeNodeset(id=str(entity_number))
-                        )
-                else:
-                    raise Exception(
-                        f"Unsupported geometry type {geometry_type} for condition {dsect_name}!"
-                    )
+                # add point sets: one nodeset instance shared by all its nodes
+                # (as within lnmmeshio's Discretization)
+                nodes = self._dis.nodes
+                nodeset = nodeset_class(id=str(entity_number))
+                for cond_node in all_cond_nodes:
+                    getattr(nodes[cond_node], nodeset_attr).append(nodeset)
 
         # -->  read-in element block info and add it to discretization
         # read * GEOMETRY sections
@@ -718,6 +835,13 @@ class FourCGeometry:
             raise Exception(
                 "At least 1 GEOMETRY section must be present when using the Exodus geometry format!"
             )
+        # group the elements by their group id (0-based element block id)
+        # in a single pass
+        elements_by_group_id = {}
+        for elements in self._dis.elements.values():
+            for ele in elements:
+                elements_by_group_id.setdefault(ele.data["GROUP_ID"], []).append(ele)
+
         # loop through geometry sections
         for geom_sect in all_geometry_sections:
             # loop through element blocks
@@ -729,37 +853,29 @@ class FourCGeometry:
                 eb_id = eb_dict_copy.pop("ID")
 
                 # now read the field
-                eb_field = next(iter(eb_dict_copy))
-                eb_field_info = eb_dict_copy[eb_field]
+                eb_field, eb_field_info = next(iter(eb_dict_copy.items()))
 
-                # read element type
-                eb_ele_type = next(iter(eb_field_info))
+                # read element type and its data
+                eb_ele_type, eb_ele_data = next(iter(eb_field_info.items()))
 
                 # read material
-                eb_material = eb_field_info[eb_ele_type]["MAT"]
+                eb_material = eb_ele_data["MAT"]
 
                 # fiber reading implemented, but not verified just yet...
-                eb_fibers = []
-                if "FIBER1" in eb_field_info[eb_ele_type]:
-                    eb_fibers.append({"FIBER1": eb_field_info[eb_ele_type]["FIBER1"]})
-                if "FIBER2" in eb_field_info[eb_ele_type]:
-                    eb_fibers.append({"FIBER2": eb_field_info[eb_ele_type]["FIBER2"]})
-                if "FIBER3" in eb_field_info[eb_ele_type]:
-                    eb_fibers.append({"FIBER3": eb_field_info[eb_ele_type]["FIBER3"]})
+                eb_fibers = [
+                    (fiber_name, eb_ele_data[fiber_name])
+                    for fiber_name in ["FIBER1", "FIBER2", "FIBER3"]
+                    if fiber_name in eb_ele_data
+                ]
 
                 # loop through block elements and append the obtained information
-                for elements in self._dis.elements.values():
-                    for ele in elements:
-                        # verify whether we are in the right block
-                        if ele.data["GROUP_ID"] == eb_id - 1:
-                            # add material
-                            ele.options["MAT"] = eb_material
-
-                            # add fibers -> verify!
-                            for eb_f in eb_fibers:
-                                ele.fibers[next(iter(eb_f))] = Fiber(
-                                    fib=np.array(eb_f[next(iter(eb_f))])
-                                )
+                for ele in elements_by_group_id.get(eb_id - 1, []):
+                    # add material
+                    ele.options["MAT"] = eb_material
+
+                    # add fibers -> verify!
+                    for fiber_name, fiber in eb_fibers:
+                        ele.fibers[fiber_name] = Fiber(fib=np.array(fiber))
 
     def convert_dis_to_vtu(self, override=True):
         """Convert discretization to vtu.
@@ -768,12 +884,20 @@ class FourCGeometry:
             override (bool, optional): Overwrite existing file. Defaults to True
         """
 
-        self.prepare_dis_for_vtu_output()
+        point_data, cell_data = self.prepare_dis_for_vtu_output()
 
-        # write case file with lnmmeshio
-        write(
+        # convert with lnmmeshio and attach the design condition flags and
+        # element data (split into the cell blocks of the mesh)
+        mesh = to_mesh(self._dis)
+        mesh.point_data.update(point_data)
+        block_offsets = np.cumsum([len(cell_block) for cell_block in mesh.cells])[:-1]
+        for name, values in cell_data.items():
+            mesh.cell_data[name] = np.split(values, block_offsets)
+
+        # write vtu file with lnmmeshio
+        write_mesh(
             self.vtu_file_path,
-            self._dis,
+            mesh,
             file_format="vtu",
             override=override,
         )
@@ -781,51 +905,121 @@ class FourCGeometry:
     def prepare_dis_for_vtu_output(self):
         """Prepares discretization for vtu conversion by adding data contained
         within the yaml file (e.g. material id, design conditions) as nodal or
-        element data."""
+        element data.
+
+        Returns:
+            tuple: A tuple containing the following elements:
+                    - point_data (dict): design condition flags (dpoint,
+                      dline, dsurf, dvol) as arrays over all nodes.
+                    - cell_data (dict): element ids, materials and fibers as
+                      arrays over all elements (in the order of the
+                      discretization).
+        """
         self._dis.compute_ids(zero_based=False)
 
+        # node indices per design condition, keyed by the point data name
+        nodeset_node_indices = {}
+
+        # node data names of the fibers (built once per fiber)
+        node_fiber_keys = {}
+
         # write node data
-        for n in self._dis.nodes:
+        for i, n in enumerate(self._dis.nodes):
             # write node id
             n.data["node-id"] = n.id
             n.data["node-coords"] = n.coords
 
             # write fibers
             for name, f in n.fibers.items():
-                n.data["node-" + name] = f.fiber
-
-            # write dpoints
-            for dp in n.pointnodesets:
-                n.data["dpoint{0}".format(dp.id)] = 1.0
-
-            # write dlines
-            for dl in n.linenodesets:
-                n.data["dline{0}".format(dl.id)] = 1.0
-
-            # write dsurfs
-            for ds in n.surfacenodesets:
-                n.data["dsurf{0}".format(ds.id)] = 1.0
-
-            # write dvols
-            for dv in n.volumenodesets:
-                n.data["dvol{0}".format(dv.id)] = 1.0
-
-        # write element data
-        for elements in self._dis.elements.values():
-            for ele in elements:
-                ele.data["element-id"] = ele.id
+                key = node_fiber_keys.get(name)
+                if key is None:
+                    key = node_fiber_keys[name] = "node-" + name
+                n.data[key] = f.fiber
+
+            # collect dpoints, dlines, dsurfs and dvols
+            for prefix, nodesets in (
+                ("dpoint", n.pointnodesets),
+                ("dline", n.linenodesets),
+                ("dsurf", n.surfacenodesets),
+                ("dvol", n.volumenodesets),
+            ):
+                for ns in nodesets:
+                    nodeset_node_indices.setdefault((prefix, ns.id), []).append(i)
+
+        # write design conditions as flag arrays
+        num_nodes = len(self._dis.nodes)
+        point_data = {}
+        for (prefix, nodeset_id), node_indices in nodeset_node_indices.items():
+            flags = np.zeros(num_nodes)
+            flags[node_indices] = 1.0
+            point_data[f"{prefix}{nodeset_id}"] = flags
+
+        # write element data column-wise
+        elements = [ele for elements in self._dis.elements.values() for ele in elements]
+        num_elements = len(elements)
+        cell_data = {
+            "element-id": np.fromiter(
+                (ele.id for ele in elements), dtype=int, count=num_elements
+            )
+        }
 
-                # write mat
-                if "MAT" in ele.options:
-                    ele.data["element-material"] = int(ele.options["MAT"])
+        # write mat and fibers (elements without them are set to zero)
+        material_indices, materials = [], []
+        fibers = {}
+        for i, ele in enumerate(elements):
+            if "MAT" in ele.options:
+                material_indices.append(i)
+                materials.append(int(ele.options["MAT"]))
+
+            for name, f in ele.fibers.items():
+                if name not in fibers:
+                    fibers[name] = ([], [])
+                fibers[name][0].append(i)
+                fibers[name][1].append(f.fiber)
+
+        # element indices and values per cell data name: materials as the
+        # smallest sufficient integer type (at least int16)
+        element_values = {
+            "element-" + name: (
+                element_indices,
+                np.asarray(values, dtype=np.float32 if QUANTIZE_FIBERS else None),
+            )
+            for name, (element_indices, values) in fibers.items()
+        }
+        if materials:
+            min_material, max_material = min(materials), max(materials)
+            material_dtype = next(
+                (
+                    dtype
+                    for dtype in (np.int16, np.int32)
+                    if np.iinfo(dtype).min <= min_material
+                    and max_material <= np.iinfo(dtype).max
+                ),
+                np.int64,
+            )
+            element_values = {
+                "element-material": (
+                    material_indices,
+                    np.asarray(materials, dtype=material_dtype),
+                ),
+                **element_values,
+            }
+
+        for name, (element_indices, values) in element_values.items():
+            cell_data[name] = np.zeros(
+                (num_elements, *values.shape[1:]), dtype=values.dtype
+            )
+            cell_data[name][element_indices] = values
 
-                # write fibers
-                for name, f in ele.fibers.items():
-                    ele.data["element-" + name] = f.fiber
+        return point_data, cell_data
 
     def __str__(self):
-        """Print representation."""
-        string = "4C Geometry"
-        string += f"\n Geometry type: {self.geom_type}"
-        string += f"\n Path to converted vtu: {self.vtu_file_path}"
-        return string
+        """Print representation (the geometry type is determined once, the
+        representation is rebuilt when the vtu file path is set)."""
+        if self._str_representation is None:
+            self._str_representation = (
+                "4C Geometry"
+                f"\n Geometry type: {self.geom_type}"
+                f"\n Path to converted vtu: {self.vtu_file_path}"
+            )
+        return self._str_representation
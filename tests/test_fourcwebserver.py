@@ -24,25 +24,32 @@ SERVER_VARS_TO_CHECK = [
 ]
 
 
-@pytest.mark.parametrize("fourc_yaml_file", TEST_FILES)
+@pytest.fixture(scope="session", params=TEST_FILES, ids=lambda f: f.stem)
+def fourc_yaml_file(request):
+    """Input file to be verified."""
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def webserver(fourc_yaml_file):
+    """Webserver for the given input file, shared by all tests of the
+    session."""
+    return FourCWebServer(fourc_yaml_file=fourc_yaml_file)
+
+
 @pytest.mark.parametrize("key, expected", SERVER_VARS_TO_CHECK)
-def test_webserver_variables(fourc_yaml_file, key, expected):
+def test_webserver_variables(webserver, fourc_yaml_file, key, expected):
     """Test that server variables are correctly initialized for different input
     files."""
-    webserver = FourCWebServer(fourc_yaml_file=fourc_yaml_file)
-
     # handle expected value if it's a callable
     expected_value = expected(fourc_yaml_file) if callable(expected) else expected
 
     assert webserver._server_vars[key] == expected_value
 
 
-@pytest.mark.parametrize("fourc_yaml_file", TEST_FILES)
-def test_webvserver_vtu_conversion(fourc_yaml_file):
+def test_webvserver_vtu_conversion(webserver, fourc_yaml_file):
     """Test that the geometric mesh can be output to a suitable vtu file for
     different input files."""
-    webserver = FourCWebServer(fourc_yaml_file=fourc_yaml_file)
-
     # check if path is not None or empty -> this means that a geometry vtu file was exported based on the given yaml file
     vtu_path = webserver.state.vtu_path
     assert vtu_path, "vtu_path should not be empty"
@@ -0,0 +1,145 @@
+"""Test the evaluation of function plots."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from fourc_webviewer.input_file_utils.fourc_yaml_file_visualization import (
+    function_plot_figure,
+)
+
+
+def component(funct_expression):
+    """Function section item of a component with the given expression."""
+    return {"COMPONENT": 0, "SYMBOLIC_FUNCTION_OF_SPACE_TIME": funct_expression}
+
+
+def variable(name, variable_type, times, **variable_data):
+    """Function section item of a variable."""
+    return {
+        "VARIABLE": 0,
+        "NAME": name,
+        "TYPE": variable_type,
+        "NUMPOINTS": len(times),
+        "TIMES": times,
+        **variable_data,
+    }
+
+
+def plot_values(funct_items, selected_funct_item="Component 0", y_val=0.0):
+    """Time points and values of the function plot of the selected function
+    item (plotted for t in [0, 1])."""
+    state_data = SimpleNamespace(
+        funct_section={"FUNCT1": funct_items},
+        selected_funct="FUNCT1",
+        selected_funct_item=selected_funct_item,
+        funct_plot={"max_time": 1.0, "x_val": 0.0, "y_val": y_val, "z_val": 0.0},
+    )
+    fig = function_plot_figure(state_data)
+    return np.asarray(fig.data[0].x), np.asarray(fig.data[0].y)
+
+
+def test_constant_expression():
+    """Test that a constant expression is plotted over all time points."""
+    t, f = plot_values({"Component 0": component("3.5")})
+
+    assert f.shape == t.shape
+    np.testing.assert_allclose(f, 3.5)
+
+
+def test_expression_with_exponent():
+    """Test that the exponent marker of a number is not read as a
+    variable."""
+    t, f = plot_values({"Component 0": component("1.0e2*t")})
+
+    np.testing.assert_allclose(f, 100.0 * t)
+
+
+def test_heaviside():
+    """Test heaviside functions without and with the value at 0."""
+    t, f = plot_values({"Component 0": component("heaviside(t-0.5)")})
+    np.testing.assert_allclose(f, np.where(t >= 0.5, 1.0, 0.0))
+
+    t, f = plot_values({"Component 0": component("heaviside(t, 0.25)")})
+    assert t[0] == 0.0
+    np.testing.assert_allclose(f, np.where(t > 0.0, 1.0, 0.25))
+    assert f[0] == 0.25
+
+
+def test_linearinterpolation():
+    """Test a linearinterpolation variable inside and outside of its
+    times."""
+    funct_items = {
+        "Component 0": component("a"),
+        "Variable 0: a": variable(
+            "a", "linearinterpolation", [0.0, 0.5, 0.8], VALUES=[1.0, 3.0, 2.0]
+        ),
+    }
+
+    def expected(t):
+        """Piecewise linear values (0 after the last time)."""
+        return np.where(
+            t <= 0.5, 1.0 + 4.0 * t, np.where(t <= 0.8, 3.0 - (t - 0.5) / 0.3, 0.0)
+        )
+
+    t, f = plot_values(funct_items)
+    np.testing.assert_allclose(f, expected(t))
+    assert f[0] == 1.0
+    np.testing.assert_allclose(f[t > 0.8], 0.0)
+
+    # the variable item itself is plotted with the same values
+    t, f = plot_values(funct_items, selected_funct_item="Variable 0: a")
+    np.testing.assert_allclose(f, expected(t))
+
+
+def test_multifunction():
+    """Test a multifunction variable with more than one time interval: each
+    description applies to its own interval, 0 outside of the times."""
+    funct_items = {
+        "Component 0": component("a"),
+        "Variable 0: a": variable(
+            "a",
+            "multifunction",
+            [0.0, 0.3, 0.8],
+            DESCRIPTION=["t^2", "1-t*y"],
+        ),
+    }
+
+    t, f = plot_values(funct_items, y_val=2.0)
+    np.testing.assert_allclose(
+        f, np.where(t < 0.3, t**2, np.where(t <= 0.8, 1.0 - 2.0 * t, 0.0))
+    )
+    assert f[0] == 0.0
+
+
+def test_nested_variables():
+    """Test variables referenced by other variables."""
+    funct_items = {
+        "Component 0": component("a+1"),
+        "Variable 0: a": variable(
+            "a", "multifunction", [0.0, 0.5, 1.0], DESCRIPTION=["2*b", "b+1"]
+        ),
+        "Variable 1: b": variable(
+            "b", "linearinterpolation", [0.0, 1.0], VALUES=[0.0, 1.0]
+        ),
+    }
+
+    t, f = plot_values(funct_items)
+    np.testing.assert_allclose(f, np.where(t < 0.5, 2.0 * t, t + 1.0) + 1.0)
+
+
+def test_variable_cycle():
+    """Test that cyclic variable definitions are rejected."""
+    funct_items = {
+        "Component 0": component("a"),
+        "Variable 0: a": variable(
+            "a", "multifunction", [0.0, 1.0], DESCRIPTION=["b+1"]
+        ),
+        "Variable 1: b": variable(
+            "b", "multifunction", [0.0, 1.0], DESCRIPTION=["2*a"]
+        ),
+    }
+
+    with pytest.raises(Exception, match="Cyclic definition of the variable a"):
+        plot_values(funct_items)
@@ -0,0 +1,39 @@
+"""Test input/output utilities for 4C input files."""
+
+import os
+
+from fourc_webviewer.input_file_utils import io_utils
+from fourc_webviewer.input_file_utils.io_utils import load_fourc_yaml
+
+
+def test_load_fourc_yaml_cache(tmp_path):
+    """Test that unchanged files are loaded from the cache and modified files
+    are parsed again."""
+    fourc_yaml_file = tmp_path / "input.4C.yaml"
+    fourc_yaml_file.write_text('TITLE:\n  - "first"\n')
+
+    content = load_fourc_yaml(fourc_yaml_file)
+    assert load_fourc_yaml(fourc_yaml_file) is content
+
+    # modification with the same size, but a new modification time
+    fourc_yaml_file.write_text('TITLE:\n  - "other"\n')
+    os.utime(fourc_yaml_file, ns=(0, fourc_yaml_file.stat().st_mtime_ns + 1))
+    assert load_fourc_yaml(fourc_yaml_file)["TITLE"] == ["other"]
+
+
+def test_load_fourc_yaml_cache_size(tmp_path):
+    """Test that the cache keeps only the last used files."""
+    for i in range(io_utils.FOURC_YAML_CACHE_SIZE + 2):
+        fourc_yaml_file = tmp_path / f"input_{i}.4C.yaml"
+        fourc_yaml_file.write_text(f'TITLE:\n  - "{i}"\n')
+        load_fourc_yaml(fourc_yaml_file)
+
+    assert len(io_utils._fourc_yaml_cache) == io_utils.FOURC_YAML_CACHE_SIZE
+
+
+def test_load_fourc_yaml_includes_not_cached(tmp_path):
+    """Test that files with includes are parsed on every load."""
+    fourc_yaml_file = tmp_path / "input.4C.yaml"
+    fourc_yaml_file.write_text('TITLE:\n  - "a"\nINCLUDES:\n  - "part.4C.yaml"\n')
+
+    assert load_fourc_yaml(fourc_yaml_file) is not load_fourc_yaml(fourc_yaml_file)
@@ -0,0 +1,27 @@
+"""Test python utilities."""
+
+from fourc_webviewer.python_utils import dict_leaves_to_number_if_schema
+
+
+def test_dict_leaves_to_number_if_schema():
+    """Test that only string leaves of number / integer type according to the
+    schema are converted, while keys unknown to the schema are kept."""
+    sections = {
+        "STRUCTURAL DYNAMIC": {
+            "TIMESTEP": "0.5",
+            "NUMSTEP": "10",
+            "DYNAMICTYPE": "Statics",
+            "UNKNOWN_PARAMETER": "3",
+        },
+        "UNKNOWN SECTION": {"VALUE": "1.0"},
+    }
+
+    assert dict_leaves_to_number_if_schema(sections) == {
+        "STRUCTURAL DYNAMIC": {
+            "TIMESTEP": 0.5,
+            "NUMSTEP": 10,
+            "DYNAMICTYPE": "Statics",
+            "UNKNOWN_PARAMETER": "3",
+        },
+        "UNKNOWN SECTION": {"VALUE": "1.0"},
+    }
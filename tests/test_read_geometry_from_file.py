@@ -0,0 +1,56 @@
+"""Test the conversion of 4C geometries to vtu files."""
+
+import os
+import shutil
+from pathlib import Path
+
+from fourc_webviewer.read_geometry_from_file import FourCGeometry
+
+TEST_FILES_DIR = Path(__file__).parent / "files"
+
+
+def copy_input(target_dir):
+    """Copy the exodus tutorial input and its mesh file to the target
+    directory."""
+    for file_name in ["tutorial_solid_exo.4C.yaml", "tutorial_solid_exo.e"]:
+        shutil.copy2(TEST_FILES_DIR / file_name, target_dir / file_name)
+    return target_dir / "tutorial_solid_exo.4C.yaml"
+
+
+def test_vtu_reuse(tmp_path):
+    """Test that the vtu file is reused for sources with unchanged content,
+    also after rewriting them."""
+    fourc_yaml_file = copy_input(tmp_path)
+
+    geometry = FourCGeometry(fourc_yaml_file, tmp_path, first_render=True)
+    assert geometry._dis is not None
+    vtu_mtime = Path(geometry.vtu_file_path).stat().st_mtime_ns
+
+    # rewrite the input with the same content (as the webserver does)
+    fourc_yaml_file.write_bytes(fourc_yaml_file.read_bytes())
+
+    reused_geometry = FourCGeometry(fourc_yaml_file, tmp_path, first_render=True)
+    assert reused_geometry._dis is None
+    assert reused_geometry.vtu_file_path == geometry.vtu_file_path
+    assert Path(reused_geometry.vtu_file_path).stat().st_mtime_ns == vtu_mtime
+
+
+def test_vtu_reconversion(tmp_path):
+    """Test that the vtu file is converted again once the content of a
+    source changes, even if the modification time is kept."""
+    fourc_yaml_file = copy_input(tmp_path)
+    mesh_file = tmp_path / "tutorial_solid_exo.e"
+    FourCGeometry(fourc_yaml_file, tmp_path, first_render=True)
+
+    # modified yaml input with its previous modification time
+    yaml_stat = fourc_yaml_file.stat()
+    fourc_yaml_file.write_text(fourc_yaml_file.read_text() + "\n")
+    os.utime(fourc_yaml_file, ns=(yaml_stat.st_atime_ns, yaml_stat.st_mtime_ns))
+    geometry = FourCGeometry(fourc_yaml_file, tmp_path, first_render=True)
+    assert geometry._dis is not None
+    assert geometry.vtu_file_path
+
+    # modified mesh file
+    mesh_file.write_bytes(mesh_file.read_bytes() + b"\0")
+    geometry = FourCGeometry(fourc_yaml_file, tmp_path, first_render=True)
+    assert geometry._dis is not None